@@ -0,0 +1,92 @@
+import argparse
+import json
+import subprocess
+import sys
+
+RENDERERS = {
+    "matplotlib": (
+        "render_monthly_data_chart",
+        "import matplotlib; matplotlib.use('Agg'); import matplotlib.pyplot",
+    ),
+    "pillow": (
+        "render_monthly_data_chart_with_pillow",
+        "from PIL import Image, ImageDraw, ImageFont",
+    ),
+}
+
+MEASURE_SCRIPT = """
+import calendar, json, random, resource, statistics, sys, time
+
+from src.modules.chart import renderers
+
+function_name, import_statement, iterations = sys.argv[1:]
+baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+started_at = time.perf_counter()
+exec(import_statement)
+import_time = time.perf_counter() - started_at
+
+render = getattr(renderers, function_name)
+months = list(calendar.month_name)[1:]
+render_times = []
+for _ in range(int(iterations)):
+    values = [random.randint(0, 1_000_000) for _ in months]
+    started_at = time.perf_counter()
+    image = render(values, months, "income", 2024)
+    render_times.append(time.perf_counter() - started_at)
+
+render_times.sort()
+print(json.dumps({
+    "import_time": import_time,
+    "median_render": statistics.median(render_times),
+    "p99_render": render_times[min(len(render_times) - 1, int(len(render_times) * 0.99))],
+    "png_size": len(image),
+    "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss,
+}))
+"""
+
+
+def measure_renderer(name: str, iterations: int):
+    function_name, import_statement = RENDERERS[name]
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            MEASURE_SCRIPT,
+            function_name,
+            import_statement,
+            str(iterations),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(iterations: int):
+    print(
+        f"{'renderer':<12} {'import ms':>10} {'median ms':>10} {'p99 ms':>10} "
+        f"{'PNG bytes':>10} {'peak RSS MB':>12}"
+    )
+    for name in RENDERERS:
+        result = measure_renderer(name, iterations)
+        print(
+            f"{name:<12} {result['import_time'] * 1000:>10.1f} "
+            f"{result['median_render'] * 1000:>10.2f} "
+            f"{result['p99_render'] * 1000:>10.2f} "
+            f"{result['png_size']:>10} "
+            f"{result['peak_rss_kb'] / 1024:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare the matplotlib and Pillow monthly chart renderers. "
+        "Each renderer runs in a fresh process; peak RSS is measured above the "
+        "interpreter baseline and includes the library import."
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    arguments = parser.parse_args()
+
+    main(arguments.iterations)
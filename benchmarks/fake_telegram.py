@@ -0,0 +1,134 @@
+import argparse
+import asyncio
+import itertools
+import time
+from collections import Counter
+
+from aiohttp import web
+
+FAKE_BOT_USER = {"id": 1, "is_bot": True, "first_name": "Fake", "username": "fake_bot"}
+TRUE_RESULT_METHODS = {
+    "answercallbackquery",
+    "deletemessage",
+    "deletewebhook",
+    "setmycommands",
+    "setwebhook",
+}
+
+
+def make_user(user_id: int):
+    return {"id": user_id, "is_bot": False, "first_name": f"User {user_id}"}
+
+
+def make_message(message_id: int, chat_id: int, text: str | None = None):
+    message = {
+        "message_id": message_id,
+        "date": int(time.time()),
+        "chat": {"id": chat_id, "type": "private"},
+        "from": make_user(chat_id),
+    }
+    if text is not None:
+        message["text"] = text
+    return message
+
+
+def make_message_update(update_id: int, chat_id: int, text: str):
+    return {"update_id": update_id, "message": make_message(update_id, chat_id, text)}
+
+
+def make_callback_query_update(update_id: int, chat_id: int, data: str):
+    return {
+        "update_id": update_id,
+        "callback_query": {
+            "id": str(update_id),
+            "from": make_user(chat_id),
+            "chat_instance": str(chat_id),
+            "message": make_message(update_id, chat_id, "..."),
+            "data": data,
+        },
+    }
+
+
+class FakeTelegramServer:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = Counter()
+        self._message_ids = itertools.count(1)
+        self._runner: web.AppRunner | None = None
+
+    def create_application(self):
+        application = web.Application(client_max_size=64 * 1024 * 1024)
+        application.router.add_post("/bot{token}/{method}", self.handle_method)
+        return application
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8090):
+        self._runner = web.AppRunner(self.create_application())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def handle_method(self, request: web.Request):
+        method = request.match_info["method"].lower()
+        self.calls[method] += 1
+
+        parameters = await request.post()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        result = self.build_result(method, parameters)
+        return web.json_response({"ok": True, "result": result})
+
+    def build_result(self, method: str, parameters):
+        if method == "getme":
+            return FAKE_BOT_USER
+        if method in TRUE_RESULT_METHODS:
+            return True
+
+        message_id = next(self._message_ids)
+        message = make_message(message_id, int(parameters.get("chat_id", 0)))
+        if method == "sendphoto":
+            message["photo"] = [
+                {
+                    "file_id": f"photo-{message_id}",
+                    "file_unique_id": f"photo-{message_id}",
+                    "width": 1000,
+                    "height": 600,
+                }
+            ]
+        elif method == "senddocument":
+            message["document"] = {
+                "file_id": f"document-{message_id}",
+                "file_unique_id": f"document-{message_id}",
+            }
+        else:
+            message["text"] = parameters.get("text", "")
+        return message
+
+
+async def serve(host: str, port: int, latency: float):
+    server = FakeTelegramServer(latency=latency)
+    await server.start(host, port)
+    print(f"Fake Telegram Bot API is listening on http://{host}:{port}")
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+        print(dict(server.calls))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run a local stand-in for the Telegram Bot API. "
+        "Point the bot at it with TELEGRAM_API_URL=http://HOST:PORT."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.0)
+    arguments = parser.parse_args()
+
+    asyncio.run(serve(arguments.host, arguments.port, arguments.latency))
@@ -0,0 +1,126 @@
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+from sqlalchemy import delete
+
+from src.database import async_session_factory
+from src.models import Company, MonthEnum, MonthlyCompanyData, User, MONTH_NUMBERS
+from src.modules.company.queries import (
+    get_monthly_company_information_query,
+    upsert_monthly_company_information_query,
+)
+
+
+async def select_then_write(data, company_id, session):
+    instance = await session.execute(
+        get_monthly_company_information_query(company_id, data["year"], data["month"])
+    )
+    instance = instance.scalar_one_or_none()
+
+    if instance:
+        instance.income = data["income"]
+        instance.expenses = data["expenses"]
+        instance.profit = data["profit"]
+        instance.kpn = data["kpn"]
+    else:
+        instance = MonthlyCompanyData(
+            company_id=company_id, month_number=MONTH_NUMBERS[data["month"]], **data
+        )
+        session.add(instance)
+
+    await session.commit()
+    await session.refresh(instance)
+    return instance
+
+
+async def upsert(data, company_id, session):
+    result = await session.scalars(
+        upsert_monthly_company_information_query(company_id, data),
+        execution_options={"populate_existing": True},
+    )
+    instance = result.one()
+    await session.commit()
+    return instance
+
+
+def generate_data(year):
+    value = random.randint(0, 1_000_000)
+    return {
+        "year": year,
+        "month": random.choice(list(MonthEnum)).value,
+        "income": value,
+        "expenses": value // 2,
+        "profit": value // 2,
+        "kpn": value // 10,
+    }
+
+
+async def run_writer(write, company_id, year, operations, latencies, errors):
+    for _ in range(operations):
+        async with async_session_factory() as session:
+            started_at = time.perf_counter()
+            try:
+                await write(generate_data(year), company_id, session)
+            except Exception:
+                errors.append(1)
+                await session.rollback()
+            latencies.append(time.perf_counter() - started_at)
+
+
+async def run_benchmark(name, write, company_id, writers, operations):
+    year = random.randint(1900, 2100)
+    latencies, errors = [], []
+
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(
+            run_writer(write, company_id, year, operations, latencies, errors)
+            for _ in range(writers)
+        )
+    )
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    print(
+        f"{name:>18}: {len(latencies) / elapsed:8.1f} writes/s  "
+        f"p50={statistics.median(latencies) * 1000:7.2f}ms  "
+        f"p99={latencies[int(len(latencies) * 0.99) - 1] * 1000:7.2f}ms  "
+        f"errors={len(errors)}"
+    )
+
+
+async def main(writers, operations):
+    user_id = -random.randint(1, 2**31 - 1)
+
+    async with async_session_factory() as session:
+        session.add(User(id=user_id, username=f"benchmark-{uuid.uuid4()}"))
+        await session.flush()
+        company = Company(name=f"benchmark-{uuid.uuid4()}"[:50], user_id=user_id)
+        session.add(company)
+        await session.commit()
+
+    try:
+        await run_benchmark(
+            "select-then-write", select_then_write, company.id, writers, operations
+        )
+        await run_benchmark("upsert", upsert, company.id, writers, operations)
+    finally:
+        async with async_session_factory() as session:
+            await session.execute(delete(Company).filter_by(id=company.id))
+            await session.execute(delete(User).filter_by(id=user_id))
+            await session.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare monthly data writes under concurrent writers."
+    )
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--operations", type=int, default=50)
+    arguments = parser.parse_args()
+
+    asyncio.run(main(arguments.writers, arguments.operations))
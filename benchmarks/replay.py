@@ -0,0 +1,256 @@
+import argparse
+import asyncio
+import datetime
+import itertools
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+
+from benchmarks.fake_telegram import FakeTelegramServer, make_message_update
+
+REPLAY_ENVIRONMENT = {
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_USER": "postgres",
+    "DB_PASS": "postgres",
+    "DB_NAME": "postgres",
+    "TELEGRAM_BOT_TOKEN": "123456:replay-benchmark",
+    "METRICS_ENABLED": "false",
+}
+UNLIMITED_DELIVERY_ENVIRONMENT = {
+    "DELIVERY_GLOBAL_RATE": "1000000",
+    "DELIVERY_GLOBAL_BURST": "1000000",
+    "DELIVERY_CHAT_RATE": "1000000",
+    "DELIVERY_CHAT_BURST": "1000000",
+}
+MONTHS = ("January", "February", "March", "April", "May", "June")
+
+
+def get_company_name(chat_id: int):
+    return f"Replay Company {chat_id}"
+
+
+def generate_onboarding_flow(chat_id: int, year: int, months: int):
+    yield "/start"
+    yield "My Company"
+    yield "Create Company"
+    yield get_company_name(chat_id)
+
+    for month in MONTHS[:months]:
+        income = 1000 * chat_id + len(month)
+        yield "Add Information"
+        yield str(year)
+        yield month
+        yield str(income)
+        yield str(income // 2)
+        yield str(income - income // 2)
+        yield str(income // 10)
+
+
+def generate_browsing_flow(chat_id: int, other_chat_id: int, year: int):
+    yield "/start"
+    yield "My Company"
+    yield "View Company"
+    yield str(year)
+    yield "Income"
+    yield "Dashboard"
+    yield "Exit"
+    yield "List of Companies"
+    yield get_company_name(other_chat_id)
+    yield str(year)
+    yield "Profit"
+    yield "Exit"
+
+
+def interleave_flows(flows: dict, update_ids):
+    updates = []
+    for texts in itertools.zip_longest(*flows.values()):
+        for chat_id, text in zip(flows, texts):
+            if text is not None:
+                updates.append(make_message_update(next(update_ids), chat_id, text))
+    return updates
+
+
+def generate_synthetic_phases(chats: int, year: int, months: int):
+    update_ids = itertools.count(1)
+    chat_ids = range(1, chats + 1)
+
+    onboarding = {
+        chat_id: generate_onboarding_flow(chat_id, year, months) for chat_id in chat_ids
+    }
+    browsing = {
+        chat_id: generate_browsing_flow(chat_id, chat_id % chats + 1, year)
+        for chat_id in chat_ids
+    }
+    return [
+        ("onboarding", interleave_flows(onboarding, update_ids)),
+        ("browsing", interleave_flows(browsing, update_ids)),
+    ]
+
+
+def load_recorded_phases(path: str):
+    with open(path, encoding="utf-8") as file:
+        updates = [json.loads(line) for line in file if line.strip()]
+    return [("recorded", updates)]
+
+
+def get_utc_date():
+    return datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+
+
+def register_sqlite_functions(dbapi_connection, connection_record):
+    dbapi_connection.create_function("now", 0, get_utc_date)
+    dbapi_connection.create_function("timezone", 2, lambda zone, value: value)
+
+
+def percentile(values: list, fraction: float):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def configure_environment(arguments, database_path: str):
+    environment = {
+        **REPLAY_ENVIRONMENT,
+        "DATABASE_URL": arguments.database_url
+        or f"sqlite+aiosqlite:///{database_path}",
+        "TELEGRAM_API_URL": f"http://127.0.0.1:{arguments.api_port}",
+    }
+    if not arguments.respect_rate_limits:
+        environment.update(UNLIMITED_DELIVERY_ENVIRONMENT)
+
+    for name, value in environment.items():
+        os.environ.setdefault(name, value)
+
+
+async def replay(arguments):
+    from aiogram import BaseMiddleware
+    from aiogram.types import Update
+    from sqlalchemy import event
+
+    from main import create_bot, dp
+    from src.bot.scheduler import update_scheduler
+    from src.database import Base, async_engine
+
+    if not arguments.verbose:
+        logging.getLogger().setLevel(logging.WARNING)
+
+    class ReplayRecorder(BaseMiddleware):
+        def __init__(self):
+            self.fed_at = {}
+            self.latencies = defaultdict(list)
+
+        async def __call__(self, handler, event, data):
+            try:
+                return await handler(event, data)
+            finally:
+                fed_at = self.fed_at.pop(data["event_update"].update_id)
+                self.latencies[data["handler"].callback.__name__].append(
+                    time.perf_counter() - fed_at
+                )
+
+    recorder = ReplayRecorder()
+    dp.message.middleware(recorder)
+    dp.callback_query.middleware(recorder)
+
+    statements = Counter()
+
+    @event.listens_for(async_engine.sync_engine, "after_cursor_execute")
+    def count_statement(connection, cursor, statement, *args):
+        statements[statement.lstrip().split(None, 1)[0].upper()] += 1
+
+    if arguments.updates:
+        phases = load_recorded_phases(arguments.updates)
+    else:
+        phases = generate_synthetic_phases(
+            arguments.chats, arguments.year, arguments.months
+        )
+
+    if async_engine.dialect.name == "sqlite":
+        event.listen(async_engine.sync_engine, "connect", register_sqlite_functions)
+
+    fake_telegram = FakeTelegramServer(latency=arguments.api_latency)
+    bot = create_bot()
+    results = []
+    started = False
+    try:
+        await fake_telegram.start(port=arguments.api_port)
+        if async_engine.dialect.name == "sqlite":
+            async with async_engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+
+        await dp.emit_startup(bot=bot, dispatcher=dp)
+        started = True
+
+        for name, updates in phases:
+            statements.clear()
+            started_at = time.perf_counter()
+
+            for payload in updates:
+                update = Update.model_validate(payload, context={"bot": bot})
+                recorder.fed_at[update.update_id] = time.perf_counter()
+                await dp.feed_update(bot, update)
+
+            while update_scheduler.pending:
+                await asyncio.sleep(0.005)
+
+            elapsed = time.perf_counter() - started_at
+            results.append((name, len(updates), elapsed, sum(statements.values())))
+    finally:
+        if started:
+            await dp.emit_shutdown(bot=bot, dispatcher=dp)
+        await bot.session.close()
+        await fake_telegram.stop()
+        await async_engine.dispose()
+
+    for name, count, elapsed, statement_count in results:
+        print(
+            f"{name}: {count} updates in {elapsed:.2f}s, "
+            f"{count / elapsed:.1f} updates/s, "
+            f"{statement_count / max(count, 1):.2f} DB statements/update"
+        )
+
+    print(f"unhandled updates: {len(recorder.fed_at)}")
+    print(f"failed updates: {update_scheduler.failed}")
+    print(f"Bot API calls: {dict(fake_telegram.calls)}")
+    print(f"{'handler':<58} {'count':>6} {'p50 ms':>9} {'p99 ms':>9}")
+    for handler_name, latencies in sorted(recorder.latencies.items()):
+        latencies.sort()
+        print(
+            f"{handler_name:<58} {len(latencies):>6} "
+            f"{percentile(latencies, 0.5) * 1000:>9.2f} "
+            f"{percentile(latencies, 0.99) * 1000:>9.2f}"
+        )
+
+    if recorder.fed_at or update_scheduler.failed:
+        print("FAIL: some updates were not handled")
+        return 1
+    return 0
+
+
+def main(arguments):
+    with tempfile.TemporaryDirectory() as directory:
+        configure_environment(arguments, os.path.join(directory, "replay.sqlite3"))
+        return asyncio.run(replay(arguments))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Replay update streams through the real dispatcher against a "
+        "fake Bot API and a throwaway SQLite database (requires aiosqlite). "
+        "Without --updates, every chat creates a company, enters monthly data "
+        "through the form, then views its own charts and retrieves another "
+        "company's chart. Pass --database-url to replay against Postgres instead."
+    )
+    parser.add_argument("--updates", default=None, help="JSONL file of raw updates")
+    parser.add_argument("--chats", type=int, default=50)
+    parser.add_argument("--months", type=int, default=3, choices=range(1, 7))
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--api-port", type=int, default=8090)
+    parser.add_argument("--api-latency", type=float, default=0.0)
+    parser.add_argument("--respect-rate-limits", action="store_true")
+    parser.add_argument("--verbose", action="store_true")
+    sys.exit(main(parser.parse_args()))
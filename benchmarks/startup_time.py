@@ -0,0 +1,97 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("matplotlib", "numpy", "PIL", "openpyxl")
+
+MEASURE_SCRIPT = f"""
+import json, sys, time
+started_at = time.perf_counter()
+import aiogram
+aiogram_import_time = time.perf_counter() - started_at
+started_at = time.perf_counter()
+import main
+print(json.dumps({{
+    "aiogram_import_time": aiogram_import_time,
+    "import_time": time.perf_counter() - started_at,
+    "heavy_modules": [name for name in {HEAVY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+PLACEHOLDER_ENVIRONMENT = {
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_USER": "postgres",
+    "DB_PASS": "postgres",
+    "DB_NAME": "postgres",
+    "TELEGRAM_BOT_TOKEN": "123456:startup-benchmark",
+}
+
+
+def measure_startup():
+    environment = {
+        **PLACEHOLDER_ENVIRONMENT,
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(
+            (PROJECT_ROOT, os.path.join(PROJECT_ROOT, "src"))
+        ),
+    }
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT],
+        capture_output=True,
+        check=True,
+        cwd=PROJECT_ROOT,
+        env=environment,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure_startup_overhead(runs: int):
+    measurements = [measure_startup() for _ in range(runs)]
+    heavy_modules = sorted(
+        {name for measurement in measurements for name in measurement["heavy_modules"]}
+    )
+    return (
+        statistics.median(
+            measurement["aiogram_import_time"] for measurement in measurements
+        ),
+        statistics.median(measurement["import_time"] for measurement in measurements),
+        heavy_modules,
+    )
+
+
+def main(runs: int, max_overhead: float):
+    aiogram_import_time, import_time, heavy_modules = measure_startup_overhead(runs)
+    print(f"import aiogram: median {aiogram_import_time:.3f}s over {runs} runs")
+    print(f"import main on top of aiogram: median {import_time:.3f}s")
+    print(f"heavy modules loaded at startup: {', '.join(heavy_modules) or 'none'}")
+
+    if heavy_modules:
+        print("FAIL: heavy modules must be imported lazily")
+        return 1
+    if import_time > max_overhead:
+        print(f"FAIL: bot imports take longer than the {max_overhead:.3f}s target")
+        return 1
+
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Check that importing the bot stays fast and does not load "
+        "heavy plotting or numeric libraries. aiogram is imported first and "
+        "timed separately, so the target only covers the bot's own modules. "
+        "Exits with 1 on regression."
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-overhead", type=float, default=1.5)
+    arguments = parser.parse_args()
+
+    sys.exit(main(arguments.runs, arguments.max_overhead))
@@ -0,0 +1,77 @@
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+
+from aiohttp import ClientSession
+
+from benchmarks.fake_telegram import FakeTelegramServer, make_message_update
+
+
+async def send_updates(url, secret, updates, concurrency):
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+    headers = {"X-Telegram-Bot-Api-Secret-Token": secret} if secret else {}
+
+    async with ClientSession(headers=headers) as session:
+
+        async def send_update(update):
+            async with semaphore:
+                started_at = time.perf_counter()
+                async with session.post(url, json=update) as response:
+                    await response.read()
+                latencies.append(time.perf_counter() - started_at)
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(send_update(update) for update in updates))
+        elapsed = time.perf_counter() - started_at
+
+    return elapsed, sorted(latencies)
+
+
+async def main(arguments):
+    fake_telegram = FakeTelegramServer(latency=arguments.api_latency)
+    await fake_telegram.start(port=arguments.api_port)
+
+    update_ids = itertools.count(1)
+    updates = [
+        make_message_update(next(update_ids), chat_id, arguments.text)
+        for _ in range(arguments.updates // arguments.chats)
+        for chat_id in range(1, arguments.chats + 1)
+    ]
+
+    try:
+        elapsed, latencies = await send_updates(
+            arguments.url, arguments.secret, updates, arguments.concurrency
+        )
+    finally:
+        await fake_telegram.stop()
+
+    print(f"updates: {len(updates)} in {elapsed:.2f}s")
+    print(f"throughput: {len(updates) / elapsed:.1f} updates/s")
+    print(
+        f"latency: p50={statistics.median(latencies) * 1000:.2f}ms "
+        f"p99={latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f}ms"
+    )
+    print(f"Bot API calls: {dict(fake_telegram.calls)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure webhook throughput. Start webhook.py with "
+        "TELEGRAM_API_URL=http://127.0.0.1:API_PORT and no WEBHOOK_BASE_URL "
+        "first; this script runs the fake Bot API on API_PORT and posts "
+        "synthetic updates to --url."
+    )
+    parser.add_argument("--url", default="http://127.0.0.1:8080/webhook")
+    parser.add_argument("--secret", default=None)
+    parser.add_argument("--api-port", type=int, default=8090)
+    parser.add_argument("--api-latency", type=float, default=0.0)
+    parser.add_argument("--updates", type=int, default=2000)
+    parser.add_argument("--chats", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--text", default="/start")
+    arguments = parser.parse_args()
+
+    asyncio.run(main(arguments))
@@ -2,40 +2,98 @@ import asyncio
 import logging
 import sys
 
+from src.bot.startup import startup_timer
 from aiogram import Bot, Dispatcher
-from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
 from aiogram.types import BotCommand
 
 from src.bot.handlers import start
 from src.bot.handlers import company
 from src.bot.handlers import monthly_company_info
-from src.middlewares import session_middleware, user_middleware
+from src.bot.handlers import admin
+from src.bot.handlers import leaderboard
+from src.bot.delivery import flood_control_middleware
+from src.bot.scheduler import update_scheduler
+from src.bot.storage import DatabaseStorage, create_fsm_storage
+from src.bot.metrics_server import start_metrics_server, stop_metrics_server
+from src.middlewares import metrics_middleware, session_middleware, user_middleware
+from src.modules.chart.services import start_chart_renderer, stop_chart_renderer
+from src.modules.leaderboard.services import (
+    start_leaderboard_refresher,
+    stop_leaderboard_refresher,
+)
 from src.config import settings
 
 logging.basicConfig(level=logging.INFO)
 API_TOKEN = settings.TELEGRAM_BOT_TOKEN
 
-dp = Dispatcher(storage=MemoryStorage())
+storage = create_fsm_storage()
+dp = Dispatcher(storage=storage)
+
+
+async def drain_updates():
+    # The Dispatcher closes the storage before this hook runs, so flush
+    # again once the queued updates have written their state.
+    await update_scheduler.close()
+    await storage.close()
+
 
 dp.include_router(start.router)
+dp.include_router(admin.router)
 dp.include_router(company.router)
+dp.include_router(leaderboard.router)
 dp.include_router(monthly_company_info.router)
 
+dp.update.outer_middleware(startup_timer)
+update_scheduler.setup(dp)
+dp.message.middleware(metrics_middleware)
 dp.message.middleware(session_middleware)
 dp.message.middleware(user_middleware)
+dp.callback_query.middleware(metrics_middleware)
+dp.callback_query.middleware(session_middleware)
+dp.callback_query.middleware(user_middleware)
+
+if isinstance(storage, DatabaseStorage) and settings.FSM_STORAGE_URL:
+    dp.startup.register(storage.setup)
+dp.startup.register(start_chart_renderer)
+dp.startup.register(start_leaderboard_refresher)
+dp.shutdown.register(drain_updates)
+dp.shutdown.register(stop_chart_renderer)
+dp.shutdown.register(stop_leaderboard_refresher)
+
+if settings.METRICS_ENABLED:
+    dp.startup.register(start_metrics_server)
+    dp.shutdown.register(stop_metrics_server)
+
+startup_timer.mark_imported()
 
 
 async def set_commands(tg_bot: Bot):
     commands = [
         BotCommand(command="/start", description="Start the bot"),
+        BotCommand(command="/stats", description="Show your company statistics"),
+        BotCommand(command="/leaderboard", description="Show the top companies"),
+        BotCommand(command="/export", description="Export your company data as CSV"),
     ]
     await tg_bot.set_my_commands(commands)
 
 
+def create_bot():
+    session = None
+    if settings.TELEGRAM_API_URL:
+        session = AiohttpSession(
+            api=TelegramAPIServer.from_base(settings.TELEGRAM_API_URL)
+        )
+    bot = Bot(token=API_TOKEN, session=session)
+    bot.session.middleware(flood_control_middleware)
+    return bot
+
+
 async def main():
-    bot = Bot(token=API_TOKEN)
+    bot = create_bot()
     await set_commands(bot)
-    await dp.start_polling(bot)
+    await dp.start_polling(bot, handle_as_tasks=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+"""add monthly data positive checks
+
+Revision ID: 0a7c3e9d1b52
+Revises: f2b6d8e0c415
+Create Date: 2026-10-18 16:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0a7c3e9d1b52"
+down_revision: Union[str, None] = "f2b6d8e0c415"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FIELDS = ("income", "expenses", "profit", "kpn")
+
+
+def upgrade() -> None:
+    for field in FIELDS:
+        op.create_check_constraint(
+            f"ck_monthly_companies_data_{field}_positive",
+            "monthly_companies_data",
+            f"{field} >= 0",
+        )
+
+
+def downgrade() -> None:
+    for field in FIELDS:
+        op.drop_constraint(
+            f"ck_monthly_companies_data_{field}_positive", "monthly_companies_data"
+        )
@@ -0,0 +1,71 @@
+"""add month_number to monthly_companies_data
+
+Revision ID: 3f1c2a7d9b10
+Revises:
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "3f1c2a7d9b10"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS = [
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "monthly_companies_data",
+        sa.Column("month_number", sa.SmallInteger(), nullable=True),
+    )
+
+    month_cases = " ".join(
+        f"WHEN '{month}' THEN {number}" for number, month in enumerate(MONTHS, 1)
+    )
+    op.execute(
+        f"UPDATE monthly_companies_data SET month_number = CASE month {month_cases} END"
+    )
+
+    op.alter_column("monthly_companies_data", "month_number", nullable=False)
+    op.create_check_constraint(
+        "ck_monthly_companies_data_month_number",
+        "monthly_companies_data",
+        "month_number BETWEEN 1 AND 12",
+    )
+    op.create_index(
+        "ix_monthly_companies_data_company_year_month",
+        "monthly_companies_data",
+        ["company_id", "year", "month_number"],
+        postgresql_include=["income", "expenses", "profit", "kpn"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_monthly_companies_data_company_year_month",
+        table_name="monthly_companies_data",
+    )
+    op.drop_constraint(
+        "ck_monthly_companies_data_month_number", "monthly_companies_data"
+    )
+    op.drop_column("monthly_companies_data", "month_number")
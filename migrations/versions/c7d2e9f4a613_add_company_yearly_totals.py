@@ -0,0 +1,52 @@
+"""add company yearly totals
+
+Revision ID: c7d2e9f4a613
+Revises: 8a4e6c0b5d21
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c7d2e9f4a613"
+down_revision: Union[str, None] = "8a4e6c0b5d21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "company_yearly_totals",
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("income", sa.BigInteger(), nullable=False),
+        sa.Column("profit", sa.BigInteger(), nullable=False),
+        sa.Column("income_rank", sa.Integer(), nullable=False),
+        sa.Column("profit_rank", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id", "year"),
+    )
+    op.create_index(
+        "ix_company_yearly_totals_year_income_rank",
+        "company_yearly_totals",
+        ["year", "income_rank"],
+    )
+    op.create_index(
+        "ix_company_yearly_totals_year_profit_rank",
+        "company_yearly_totals",
+        ["year", "profit_rank"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_company_yearly_totals_year_profit_rank", table_name="company_yearly_totals"
+    )
+    op.drop_index(
+        "ix_company_yearly_totals_year_income_rank", table_name="company_yearly_totals"
+    )
+    op.drop_table("company_yearly_totals")
@@ -0,0 +1,31 @@
+"""add company data version
+
+Revision ID: d3a8b1f5c702
+Revises: c7d2e9f4a613
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d3a8b1f5c702"
+down_revision: Union[str, None] = "c7d2e9f4a613"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "companies",
+        sa.Column(
+            "data_version", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("companies", "data_version")
@@ -0,0 +1,36 @@
+"""add fsm states
+
+Revision ID: e91f4c2b7a38
+Revises: d3a8b1f5c702
+Create Date: 2026-10-18 16:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e91f4c2b7a38"
+down_revision: Union[str, None] = "d3a8b1f5c702"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Earlier releases created the table on bot startup.
+    if sa.inspect(op.get_bind()).has_table("fsm_states"):
+        return
+
+    op.create_table(
+        "fsm_states",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("state", sa.String(), nullable=True),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("fsm_states")
@@ -0,0 +1,25 @@
+"""drop users username unique
+
+Revision ID: f2b6d8e0c415
+Revises: e91f4c2b7a38
+Create Date: 2026-10-18 16:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "f2b6d8e0c415"
+down_revision: Union[str, None] = "e91f4c2b7a38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("users_username_key", "users", type_="unique")
+
+
+def downgrade() -> None:
+    op.create_unique_constraint("users_username_key", "users", ["username"])
@@ -0,0 +1,16 @@
+from aiogram.filters.callback_data import CallbackData
+
+
+class CompanyPageCallback(CallbackData, prefix="companies"):
+    direction: str
+    cursor: int
+
+
+class CompanySelectCallback(CallbackData, prefix="company"):
+    id: int
+
+
+class LeaderboardCallback(CallbackData, prefix="leaderboard"):
+    field: str
+    year: int
+    page: int
@@ -0,0 +1,170 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import time
+
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware
+from aiogram.exceptions import TelegramRetryAfter
+
+from src.cache import LRUCache
+from src.config import settings
+
+INTERACTIVE_PRIORITY = 0
+BULK_PRIORITY = 1
+
+delivery_priority = contextvars.ContextVar(
+    "delivery_priority", default=INTERACTIVE_PRIORITY
+)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+
+    def try_acquire(self):
+        now = time.monotonic()
+        if now < self.blocked_until:
+            return self.blocked_until - now
+
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def release(self):
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+    def block(self, seconds: float):
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    async def acquire(self):
+        while delay := self.try_acquire():
+            await asyncio.sleep(delay)
+
+
+class PriorityRateLimiter:
+    def __init__(self, rate: float, capacity: float):
+        self.bucket = TokenBucket(rate, capacity)
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._dispatch_task: asyncio.Task | None = None
+
+    @property
+    def queue_depth(self):
+        return len(self._waiters)
+
+    def block(self, seconds: float):
+        self.bucket.block(seconds)
+
+    async def acquire(self, priority: int):
+        if not self._waiters and not self.bucket.try_acquire():
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        if self._dispatch_task is None:
+            self._dispatch_task = asyncio.create_task(self._dispatch())
+        await future
+
+    async def _dispatch(self):
+        try:
+            while self._waiters:
+                delay = self.bucket.try_acquire()
+                if delay:
+                    await asyncio.sleep(delay)
+                    continue
+
+                _, _, future = heapq.heappop(self._waiters)
+                if future.done():
+                    self.bucket.release()
+                else:
+                    future.set_result(None)
+        finally:
+            self._dispatch_task = None
+
+
+class FloodControlMiddleware(BaseRequestMiddleware):
+    def __init__(self):
+        self.global_limiter = PriorityRateLimiter(
+            settings.DELIVERY_GLOBAL_RATE, settings.DELIVERY_GLOBAL_BURST
+        )
+        self.chat_buckets = LRUCache(max_entries=settings.DELIVERY_MAX_TRACKED_CHATS)
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.total_wait_time = 0.0
+
+    def set_global_rate(self, rate: float, capacity: float):
+        self.global_limiter = PriorityRateLimiter(rate, capacity)
+
+    def get_chat_bucket(self, chat_id):
+        bucket = self.chat_buckets.get(chat_id)
+        if bucket is None:
+            if isinstance(chat_id, int) and chat_id > 0:
+                bucket = TokenBucket(
+                    settings.DELIVERY_CHAT_RATE, settings.DELIVERY_CHAT_BURST
+                )
+            else:
+                bucket = TokenBucket(
+                    settings.DELIVERY_GROUP_RATE, settings.DELIVERY_GROUP_BURST
+                )
+            self.chat_buckets.set(chat_id, bucket)
+        return bucket
+
+    def get_metrics(self):
+        return {
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+            "queue_depth": self.global_limiter.queue_depth,
+            "total_wait_time": self.total_wait_time,
+        }
+
+    async def __call__(self, make_request, bot, method):
+        chat_id = getattr(method, "chat_id", None)
+        if chat_id is None:
+            return await make_request(bot, method)
+
+        chat_bucket = self.get_chat_bucket(chat_id)
+        priority = delivery_priority.get()
+
+        for attempt in range(settings.DELIVERY_MAX_RETRIES + 1):
+            started_at = time.monotonic()
+            await chat_bucket.acquire()
+            await self.global_limiter.acquire(priority)
+            self.total_wait_time += time.monotonic() - started_at
+
+            try:
+                response = await make_request(bot, method)
+            except TelegramRetryAfter as retry_after:
+                if attempt == settings.DELIVERY_MAX_RETRIES:
+                    self.failed += 1
+                    raise
+
+                logging.warning(
+                    f"Flood control for chat {chat_id}, "
+                    f"retrying in {retry_after.retry_after}s"
+                )
+                self.retried += 1
+                # A 429 is Telegram's flood signal for the whole bot, so hold
+                # back every chat, not only the one that hit it.
+                chat_bucket.block(retry_after.retry_after)
+                self.global_limiter.block(retry_after.retry_after)
+                continue
+
+            self.sent += 1
+            return response
+
+
+flood_control_middleware = FloodControlMiddleware()
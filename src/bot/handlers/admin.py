@@ -0,0 +1,104 @@
+import logging
+
+from aiogram import Router, types
+from aiogram.filters import Command, CommandObject
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.user.services import UserIdentity
+from src.modules.broadcast.services import (
+    create_broadcast,
+    get_or_none_broadcast_by_id,
+    running_broadcasts,
+    start_broadcast,
+    stop_broadcast,
+)
+
+router = Router()
+
+
+def get_broadcast_progress_text(broadcast):
+    return (
+        f"Broadcast #{broadcast.id} is {broadcast.status}: "
+        f"{broadcast.sent} sent, {broadcast.failed} failed."
+    )
+
+
+async def start_broadcast_with_progress(message: types.Message, broadcast):
+    progress_message = await message.answer(get_broadcast_progress_text(broadcast))
+
+    async def report_progress(current_broadcast):
+        try:
+            await progress_message.edit_text(
+                get_broadcast_progress_text(current_broadcast)
+            )
+        except Exception as exception:
+            logging.warning(f"Could not report broadcast progress: {str(exception)}")
+
+    start_broadcast(message.bot, broadcast, report_progress)
+
+
+@router.message(Command("broadcast"))
+async def broadcast_command_handler(
+    message: types.Message,
+    command: CommandObject,
+    user: UserIdentity,
+    session: AsyncSession,
+):
+    if not user.is_admin:
+        await message.answer("This command is available only for admins.")
+        return
+
+    if not command.args:
+        await message.answer("Usage: /broadcast <text>")
+        return
+
+    broadcast = await create_broadcast(command.args, user.id, session)
+    await start_broadcast_with_progress(message, broadcast)
+
+
+@router.message(Command("broadcast_resume"))
+async def broadcast_resume_command_handler(
+    message: types.Message,
+    command: CommandObject,
+    user: UserIdentity,
+    session: AsyncSession,
+):
+    if not user.is_admin:
+        await message.answer("This command is available only for admins.")
+        return
+
+    if not command.args or not command.args.isdigit():
+        await message.answer("Usage: /broadcast_resume <id>")
+        return
+
+    broadcast = await get_or_none_broadcast_by_id(int(command.args), session)
+    if broadcast is None or broadcast.status == "completed":
+        await message.answer("There is no unfinished broadcast with this id.")
+        return
+
+    if broadcast.id in running_broadcasts:
+        await message.answer("This broadcast is already running.")
+        return
+
+    await start_broadcast_with_progress(message, broadcast)
+
+
+@router.message(Command("broadcast_stop"))
+async def broadcast_stop_command_handler(
+    message: types.Message, command: CommandObject, user: UserIdentity
+):
+    if not user.is_admin:
+        await message.answer("This command is available only for admins.")
+        return
+
+    if not command.args or not command.args.isdigit():
+        await message.answer("Usage: /broadcast_stop <id>")
+        return
+
+    if stop_broadcast(int(command.args)):
+        await message.answer(
+            f"Broadcast #{command.args} is paused. "
+            f"Use /broadcast_resume {command.args} to continue."
+        )
+    else:
+        await message.answer("This broadcast is not running.")
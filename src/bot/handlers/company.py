@@ -1,15 +1,27 @@
 import logging
 
 from aiogram import Router, types
-from aiogram.filters import StateFilter
+from aiogram.filters import Command, CommandObject, StateFilter
 from aiogram.fsm.context import FSMContext
-from aiogram.types import ReplyKeyboardMarkup, KeyboardButton, ReplyKeyboardRemove
+from aiogram.types import (
+    ReplyKeyboardMarkup,
+    KeyboardButton,
+    ReplyKeyboardRemove,
+    InlineKeyboardMarkup,
+    InlineKeyboardButton,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models import User
+from src.modules.user.services import UserIdentity
+from src.bot.callbacks import (
+    CompanyPageCallback,
+    CompanySelectCallback,
+    LeaderboardCallback,
+)
 from bot.states import (
     CompanyCreationForm,
     MonthlyCompanyDataForm,
+    MonthlyCompanyDataImportForm,
     ViewMonthlyCompanyDataForm,
     RetrieveCompanyDataForm,
 )
@@ -22,6 +34,16 @@ from src.modules.company.services import (
     delete_company,
     get_company_list,
     get_all_distinct_years_for_the_user_company_by_id,
+    get_company_history,
+)
+from src.modules.company.exports import (
+    SpooledInputFile,
+    create_export_file,
+    export_monthly_company_information,
+)
+from src.modules.company.statistics import (
+    calculate_company_statistics,
+    format_company_statistics,
 )
 
 router = Router()
@@ -45,11 +67,59 @@ def generate_list_of_buttons_based_on_enum(keyboards_enum):
     return ReplyKeyboardMarkup(keyboard=keyboard, resize_keyboard=True)
 
 
+def generate_company_list_keyboard(companies, has_previous: bool, has_next: bool):
+    keyboard = [
+        [
+            InlineKeyboardButton(
+                text=company.name,
+                callback_data=CompanySelectCallback(id=company.id).pack(),
+            )
+        ]
+        for company in companies
+    ]
+
+    navigation = []
+    if has_previous:
+        navigation.append(
+            InlineKeyboardButton(
+                text="« Previous",
+                callback_data=CompanyPageCallback(
+                    direction="prev", cursor=companies[0].id
+                ).pack(),
+            )
+        )
+    if has_next:
+        navigation.append(
+            InlineKeyboardButton(
+                text="Next »",
+                callback_data=CompanyPageCallback(
+                    direction="next", cursor=companies[-1].id
+                ).pack(),
+            )
+        )
+    if navigation:
+        keyboard.append(navigation)
+
+    keyboard.append(
+        [
+            InlineKeyboardButton(
+                text="Leaderboard",
+                callback_data=LeaderboardCallback(
+                    field="income", year=0, page=0
+                ).pack(),
+            )
+        ]
+    )
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+
+
 async def get_company_exists_buttons():
     return ReplyKeyboardMarkup(
         keyboard=[
             [KeyboardButton(text="View Company")],
             [KeyboardButton(text="Add Information")],
+            [KeyboardButton(text="Import Information")],
+            [KeyboardButton(text="Export Information")],
             [KeyboardButton(text="Delete Company")],
             [KeyboardButton(text="Exit")],
         ],
@@ -67,7 +137,7 @@ async def get_company_not_exists_buttons():
     )
 
 
-async def send_company_options(user: User, message: types.Message):
+async def send_company_options(user: UserIdentity, message: types.Message):
     if user.company:
         kb = await get_company_exists_buttons()
         await message.answer("Choose an option for your company:", reply_markup=kb)
@@ -82,21 +152,44 @@ async def send_company_options(user: User, message: types.Message):
 async def list_of_companies_handler(
     message: types.Message, state: FSMContext, session: AsyncSession
 ):
-    companies = await get_company_list(session)
+    companies, has_previous, has_next = await get_company_list(session)
 
     if not companies:
         await message.answer("No companies available.")
         return
 
-    companies_keyboard = generate_list_of_buttons_based_on_list(companies)
+    companies_keyboard = generate_company_list_keyboard(
+        companies, has_previous, has_next
+    )
     await message.answer("Please select a company:", reply_markup=companies_keyboard)
 
     await state.set_state(RetrieveCompanyDataForm.name)
 
 
+@router.callback_query(CompanyPageCallback.filter())
+async def list_of_companies_page_handler(
+    callback: types.CallbackQuery,
+    callback_data: CompanyPageCallback,
+    session: AsyncSession,
+):
+    if callback_data.direction == "prev":
+        page = await get_company_list(session, before_company_id=callback_data.cursor)
+    else:
+        page = await get_company_list(session, after_company_id=callback_data.cursor)
+
+    companies, has_previous, has_next = page
+    if companies:
+        await callback.message.edit_reply_markup(
+            reply_markup=generate_company_list_keyboard(
+                companies, has_previous, has_next
+            )
+        )
+    await callback.answer()
+
+
 @router.message(lambda message: message.text == "Create Company")
 async def create_company_command_handler(
-    message: types.Message, state: FSMContext, user: User
+    message: types.Message, state: FSMContext, user: UserIdentity
 ):
     logging.info("In Company create action")
     logging.info(f"User company exists validation: {user.company}")
@@ -112,7 +205,7 @@ async def create_company_command_handler(
 
 @router.message(StateFilter(CompanyCreationForm.name))
 async def create_company_command_state_handler(
-    message: types.Message, state: FSMContext, user: User, session: AsyncSession
+    message: types.Message, state: FSMContext, user: UserIdentity, session: AsyncSession
 ):
     logging.info("In 'create_company_command_state_handler' function")
     kb = await get_company_exists_buttons()
@@ -145,7 +238,7 @@ async def create_company_command_state_handler(
 
 @router.message(lambda message: message.text == "Delete Company")
 async def delete_company_handler(
-    message: types.Message, user: User, session: AsyncSession
+    message: types.Message, user: UserIdentity, session: AsyncSession
 ):
     logging.info("In 'handle_delete_company' function")
     kb = await get_company_not_exists_buttons()
@@ -163,7 +256,7 @@ async def delete_company_handler(
 
 @router.message(lambda message: message.text == "Add Information")
 async def add_information_handler(
-    message: types.Message, state: FSMContext, user: User
+    message: types.Message, state: FSMContext, user: UserIdentity
 ):
     if not user.company:
         await message.answer("You don't have a company to add information to.")
@@ -175,9 +268,76 @@ async def add_information_handler(
     await state.set_state(MonthlyCompanyDataForm.year)
 
 
+@router.message(lambda message: message.text == "Import Information")
+async def import_information_handler(
+    message: types.Message, state: FSMContext, user: UserIdentity
+):
+    if not user.company:
+        await message.answer("You don't have a company to import information to.")
+        return
+
+    await message.answer(
+        "Please send a CSV or XLSX file with the columns: "
+        "year, month, income, expenses, profit, kpn.",
+        reply_markup=ReplyKeyboardRemove(),
+    )
+    await state.set_state(MonthlyCompanyDataImportForm.document)
+
+
+async def send_export(
+    message: types.Message,
+    session: AsyncSession,
+    company_id: int | None,
+    file_name: str,
+):
+    with create_export_file() as file:
+        exported_count = await export_monthly_company_information(
+            file, session, company_id
+        )
+        if not exported_count:
+            await message.answer("No data available to export.")
+            return
+
+        await message.answer_document(
+            SpooledInputFile(file, file_name),
+            caption=f"Exported {exported_count} monthly records.",
+        )
+
+
+@router.message(lambda message: message.text == "Export Information")
+async def export_information_handler(
+    message: types.Message, user: UserIdentity, session: AsyncSession
+):
+    if not user.company:
+        await message.answer("You don't have a company to export information from.")
+        return
+
+    await send_export(
+        message, session, user.company.id, f"company_{user.company.id}_data.csv"
+    )
+
+
+@router.message(Command("export"))
+async def export_command_handler(
+    message: types.Message,
+    command: CommandObject,
+    user: UserIdentity,
+    session: AsyncSession,
+):
+    if command.args and command.args.strip() == "all":
+        if not user.is_admin:
+            await message.answer("This command is available only for admins.")
+            return
+
+        await send_export(message, session, None, "companies_data.csv")
+        return
+
+    await export_information_handler(message, user, session)
+
+
 @router.message(lambda message: message.text == "View Company")
 async def view_user_company_handler(
-    message: types.Message, state: FSMContext, user: User, session: AsyncSession
+    message: types.Message, state: FSMContext, user: UserIdentity, session: AsyncSession
 ):
     if not user.company:
         await message.answer("You don't have a company.")
@@ -194,3 +354,20 @@ async def view_user_company_handler(
     years_keyboard = generate_list_of_buttons_based_on_list(years)
     await message.answer("Please select a year:", reply_markup=years_keyboard)
     await state.set_state(ViewMonthlyCompanyDataForm.year)
+
+
+@router.message(Command("stats"))
+async def company_statistics_handler(
+    message: types.Message, user: UserIdentity, session: AsyncSession
+):
+    if not user.company:
+        await message.answer("You don't have a company.")
+        return
+
+    rows = await get_company_history(user.company.id, session)
+    if not rows:
+        await message.answer("No data available for your company.")
+        return
+
+    statistics = calculate_company_statistics(rows)
+    await message.answer(format_company_statistics(user.company.name, statistics))
@@ -0,0 +1,129 @@
+from aiogram import Router, types
+from aiogram.filters import Command, CommandObject
+from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.user.services import UserIdentity
+from src.bot.callbacks import LeaderboardCallback
+from src.config import settings
+from src.modules.leaderboard.queries import LEADERBOARD_FIELDS
+from src.modules.leaderboard.services import (
+    get_latest_leaderboard_year,
+    get_leaderboard_page,
+    get_company_leaderboard_position,
+)
+
+router = Router()
+
+
+def generate_leaderboard_keyboard(field: str, year: int, page: int, has_next: bool):
+    fields = [
+        InlineKeyboardButton(
+            text=f"By {other_field}",
+            callback_data=LeaderboardCallback(
+                field=other_field, year=year, page=0
+            ).pack(),
+        )
+        for other_field in LEADERBOARD_FIELDS
+        if other_field != field
+    ]
+
+    navigation = []
+    if page > 0:
+        navigation.append(
+            InlineKeyboardButton(
+                text="« Previous",
+                callback_data=LeaderboardCallback(
+                    field=field, year=year, page=page - 1
+                ).pack(),
+            )
+        )
+    if has_next:
+        navigation.append(
+            InlineKeyboardButton(
+                text="Next »",
+                callback_data=LeaderboardCallback(
+                    field=field, year=year, page=page + 1
+                ).pack(),
+            )
+        )
+
+    keyboard = [fields]
+    if navigation:
+        keyboard.append(navigation)
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+
+
+async def get_leaderboard_message(
+    field: str, year: int, page: int, user: UserIdentity, session: AsyncSession
+):
+    rows, has_next = await get_leaderboard_page(year, field, page, session)
+    if not rows:
+        return f"No leaderboard data for {year} yet.", None
+
+    lines = [f"Top companies by {field} in {year}:"]
+    lines.extend(f"{rank}. {name} - {total:,}" for rank, name, total in rows)
+
+    if user.company:
+        position = await get_company_leaderboard_position(
+            user.company.id, year, field, session
+        )
+        if position is not None:
+            rank, total, count = position
+            lines.append("")
+            lines.append(f"Your company: #{rank} of {count} ({total:,})")
+
+    lines.append("")
+    lines.append(
+        f"Updated every {settings.LEADERBOARD_REFRESH_INTERVAL / 60:.0f} minutes."
+    )
+    return "\n".join(lines), generate_leaderboard_keyboard(field, year, page, has_next)
+
+
+@router.message(Command("leaderboard"))
+async def leaderboard_command_handler(
+    message: types.Message,
+    command: CommandObject,
+    user: UserIdentity,
+    session: AsyncSession,
+):
+    if command.args:
+        if not command.args.strip().isdigit():
+            await message.answer("Usage: /leaderboard [year]")
+            return
+        year = int(command.args)
+    else:
+        year = await get_latest_leaderboard_year(session)
+
+    if year is None:
+        await message.answer("No leaderboard data yet.")
+        return
+
+    text, keyboard = await get_leaderboard_message("income", year, 0, user, session)
+    await message.answer(text, reply_markup=keyboard)
+
+
+@router.callback_query(LeaderboardCallback.filter())
+async def leaderboard_page_handler(
+    callback: types.CallbackQuery,
+    callback_data: LeaderboardCallback,
+    user: UserIdentity,
+    session: AsyncSession,
+):
+    if callback_data.field not in LEADERBOARD_FIELDS:
+        await callback.answer()
+        return
+
+    year = callback_data.year or await get_latest_leaderboard_year(session)
+    if year is None:
+        await callback.answer("No leaderboard data yet.")
+        return
+
+    text, keyboard = await get_leaderboard_message(
+        callback_data.field, year, callback_data.page, user, session
+    )
+    if callback_data.year:
+        await callback.message.edit_text(text, reply_markup=keyboard)
+    else:
+        await callback.message.answer(text, reply_markup=keyboard)
+    await callback.answer()
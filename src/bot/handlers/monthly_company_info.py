@@ -1,9 +1,8 @@
 import io
 import logging
 
-import matplotlib.pyplot as plt
-
 from aiogram import Router, types
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.types import (
@@ -19,9 +18,12 @@ from src.bot.handlers.company import (
     generate_list_of_buttons_based_on_enum,
     generate_list_of_buttons_based_on_list,
 )
-from src.models import User, MonthEnum
+from src.models import MonthEnum
+from src.modules.user.services import UserIdentity
+from src.bot.callbacks import CompanySelectCallback
 from bot.states import (
     MonthlyCompanyDataForm,
+    MonthlyCompanyDataImportForm,
     ViewMonthlyCompanyDataForm,
     RetrieveCompanyDataForm,
 )
@@ -32,32 +34,82 @@ from src.modules.company.validations import (
 )
 from src.modules.company.services import (
     create_or_update_monthly_company_information_instance,
-    get_data_for_the_selected_year_and_attribute,
     get_all_distinct_years_for_the_user_company_by_id,
+    get_company_data_version,
+    get_data_for_the_selected_year,
     get_or_none_company_by_name,
 )
+from src.modules.company.imports import (
+    UnsupportedImportFileError,
+    import_monthly_company_information,
+)
+from src.config import settings
+from src.modules.chart.cache import chart_file_id_cache, get_chart_cache_key
+from src.modules.chart.services import (
+    ChartRendererBusyError,
+    get_monthly_data_chart,
+)
 
 router = Router()
 
 
-def generate_monthly_data_chart_based_on_company_records(
-    records, selected_field, selected_year
+async def answer_monthly_data_chart(
+    message: types.Message,
+    company_id: int,
+    selected_field: str,
+    selected_year: int,
+    session: AsyncSession,
+    data=None,
 ):
-    values = [record[0] for record in records]
-    months = [record[1] for record in records]
+    # The prefetched year carries the version it was read at; this chat's own
+    # writes clear the FSM data, so it is only re-read when nothing matches.
+    year_records = None
+    if (
+        data is not None
+        and data.get("year_data_company_id") == company_id
+        and data.get("year") == selected_year
+    ):
+        data_version = data["year_data_version"]
+        year_records = data["year_data"]
+    else:
+        data_version = await get_company_data_version(company_id, session)
+
+    cache_key = get_chart_cache_key(
+        company_id, selected_year, selected_field, data_version
+    )
+
+    file_id = chart_file_id_cache.get(cache_key)
+    if file_id is not None:
+        try:
+            await message.answer_photo(file_id)
+            return True
+        except TelegramBadRequest as bad_request:
+            logging.warning(f"Cached chart file_id was rejected: {str(bad_request)}")
+            chart_file_id_cache.invalidate(cache_key)
+
+    image_bytes = await get_monthly_data_chart(
+        company_id, selected_field, selected_year, session, data_version, year_records
+    )
+    if image_bytes is None:
+        return False
 
-    plt.figure(figsize=(10, 6))
-    plt.bar(months, values, color="blue")
-    plt.xlabel("MONTH")
-    plt.ylabel(selected_field.upper())
-    plt.title(f"{selected_field.upper()} for {selected_year}")
+    image_file = BufferedInputFile(image_bytes, filename="diagram.png")
+    sent_message = await message.answer_photo(image_file)
+    chart_file_id_cache.set(cache_key, sent_message.photo[-1].file_id)
+    return True
 
-    image_stream = io.BytesIO()
-    plt.savefig(image_stream, format="png")
-    image_stream.seek(0)
-    plt.close()
 
-    return image_stream
+async def prefetch_year_data(
+    state: FSMContext, company_id: int, selected_year: int, session: AsyncSession
+):
+    data_version = await get_company_data_version(company_id, session)
+    records = await get_data_for_the_selected_year(company_id, selected_year, session)
+    await state.update_data(
+        year=selected_year,
+        year_data_company_id=company_id,
+        year_data=[list(record) for record in records],
+        year_data_version=data_version,
+    )
 
 
 def get_monthly_company_information_attributes_keyboard():
@@ -65,6 +117,7 @@ def get_monthly_company_information_attributes_keyboard():
         keyboard=[
             [KeyboardButton(text="Income"), KeyboardButton(text="Expenses")],
             [KeyboardButton(text="Profit"), KeyboardButton(text="KPN")],
+            [KeyboardButton(text="Dashboard")],
             [KeyboardButton(text="Exit")],
         ],
         resize_keyboard=True,
@@ -181,7 +234,7 @@ async def handle_profit_input(message: types.Message, state: FSMContext):
 
 @router.message(StateFilter(MonthlyCompanyDataForm.kpn))
 async def handle_kpn_input(
-    message: types.Message, state: FSMContext, session: AsyncSession, user: User
+    message: types.Message, state: FSMContext, session: AsyncSession, user: UserIdentity
 ):
     kb = await get_company_exists_buttons()
 
@@ -212,10 +265,55 @@ async def handle_kpn_input(
         await message.answer(str(exception))
 
 
+@router.message(StateFilter(MonthlyCompanyDataImportForm.document))
+async def handle_import_document(
+    message: types.Message, state: FSMContext, session: AsyncSession, user: UserIdentity
+):
+    kb = await get_company_exists_buttons()
+
+    if not message.document:
+        await message.answer("Please send the data as a CSV or XLSX file.")
+        return
+
+    if (message.document.file_size or 0) > settings.IMPORT_MAX_FILE_SIZE:
+        await message.answer("The file is too large.")
+        return
+
+    try:
+        file = await message.bot.download(message.document, destination=io.BytesIO())
+        imported_count, errors = await import_monthly_company_information(
+            file, message.document.file_name, user.company, session
+        )
+    except UnsupportedImportFileError as unsupported_error:
+        await message.answer(str(unsupported_error))
+        return
+    except Exception as exception:
+        logging.error(f"Error while importing monthly data: {str(exception)}")
+        await message.answer(
+            f"There was an error importing the file. Exception: {str(exception)}"
+        )
+        return
+
+    lines = [f"Imported {imported_count} monthly records."]
+    if errors:
+        lines.append(f"Skipped {len(errors)} invalid rows:")
+        for line_number, content in errors[: settings.IMPORT_MAX_REPORTED_ERRORS]:
+            lines.append(f"Row {line_number}: {content}")
+        if len(errors) > settings.IMPORT_MAX_REPORTED_ERRORS:
+            lines.append(
+                f"...and {len(errors) - settings.IMPORT_MAX_REPORTED_ERRORS} more."
+            )
+
+    await message.answer("\n".join(lines), reply_markup=kb)
+    await state.clear()
+
+
 @router.message(StateFilter(ViewMonthlyCompanyDataForm.year))
-async def handle_year_selection(message: types.Message, state: FSMContext):
+async def handle_year_selection(
+    message: types.Message, state: FSMContext, session: AsyncSession, user: UserIdentity
+):
     selected_year = int(message.text)
-    await state.update_data(year=selected_year)
+    await prefetch_year_data(state, user.company.id, selected_year, session)
 
     attributes_keyboard = get_monthly_company_information_attributes_keyboard()
     await message.answer(
@@ -226,7 +324,7 @@ async def handle_year_selection(message: types.Message, state: FSMContext):
 
 @router.message(StateFilter(ViewMonthlyCompanyDataForm.field))
 async def handle_attribute_name_selection(
-    message: types.Message, state: FSMContext, session: AsyncSession, user: User
+    message: types.Message, state: FSMContext, session: AsyncSession, user: UserIdentity
 ):
     logging.info("In {handle_field_selection} function.")
     try:
@@ -235,19 +333,19 @@ async def handle_attribute_name_selection(
         selected_year = int(data["year"])
         selected_field = message.text.lower()
 
-        records = await get_data_for_the_selected_year_and_attribute(
-            user.company.id, selected_field, selected_year, session
+        is_sent = await answer_monthly_data_chart(
+            message,
+            user.company.id,
+            selected_field,
+            selected_year,
+            session,
+            data,
         )
-        if not records:
+        if not is_sent:
             await message.answer("No data available for the selected field.")
-            return
-
-        image_stream = generate_monthly_data_chart_based_on_company_records(
-            records, selected_field, selected_year
-        )
-
-        image_file = BufferedInputFile(image_stream.getvalue(), filename="diagram.png")
-        await message.answer_photo(image_file)
+    except ChartRendererBusyError as busy_error:
+        logging.warning(str(busy_error))
+        await message.answer(str(busy_error))
     except Exception as exception:
         logging.error(f"Error while sending diagram: {str(exception)}")
         await message.answer(
@@ -256,28 +354,46 @@ async def handle_attribute_name_selection(
         )
 
 
+async def send_years_for_retrieve_company(
+    message: types.Message, state: FSMContext, company_id: int, session: AsyncSession
+):
+    await state.update_data(company_id=company_id)
+
+    years = await get_all_distinct_years_for_the_user_company_by_id(company_id, session)
+    years_keyboard = generate_list_of_buttons_based_on_list(years)
+    await message.answer("Please select a year:", reply_markup=years_keyboard)
+    await state.set_state(RetrieveCompanyDataForm.year)
+
+
 @router.message(StateFilter(RetrieveCompanyDataForm.name))
 async def handle_name_selection_for_retrieve_company(
     message: types.Message, state: FSMContext, session: AsyncSession
 ):
     name = message.text
     instance = await get_or_none_company_by_name(name, session)
-    await state.update_data(company_id=instance.id)
+    await send_years_for_retrieve_company(message, state, instance.id, session)
+
 
-    years = await get_all_distinct_years_for_the_user_company_by_id(
-        instance.id, session
+@router.callback_query(CompanySelectCallback.filter())
+async def handle_company_selection_for_retrieve_company(
+    callback: types.CallbackQuery,
+    callback_data: CompanySelectCallback,
+    state: FSMContext,
+    session: AsyncSession,
+):
+    await send_years_for_retrieve_company(
+        callback.message, state, callback_data.id, session
     )
-    years_keyboard = generate_list_of_buttons_based_on_list(years)
-    await message.answer("Please select a year:", reply_markup=years_keyboard)
-    await state.set_state(RetrieveCompanyDataForm.year)
+    await callback.answer()
 
 
 @router.message(StateFilter(RetrieveCompanyDataForm.year))
 async def handle_year_selection_for_retrieve_company(
-    message: types.Message, state: FSMContext
+    message: types.Message, state: FSMContext, session: AsyncSession
 ):
     selected_year = int(message.text)
-    await state.update_data(year=selected_year)
+    data = await state.get_data()
+    await prefetch_year_data(state, int(data["company_id"]), selected_year, session)
 
     attributes_keyboard = get_monthly_company_information_attributes_keyboard()
     await message.answer(
@@ -299,16 +415,19 @@ async def handle_attribute_name_selection_for_retrieve_company(
         selected_field = message.text.lower()
 
         logging.info("Step 2")
-        records = await get_data_for_the_selected_year_and_attribute(
-            selected_company_id, selected_field, selected_year, session
-        )
-
-        image_stream = generate_monthly_data_chart_based_on_company_records(
-            records, selected_field, selected_year
+        is_sent = await answer_monthly_data_chart(
+            message,
+            selected_company_id,
+            selected_field,
+            selected_year,
+            session,
+            data,
         )
-
-        image_file = BufferedInputFile(image_stream.getvalue(), filename="diagram.png")
-        await message.answer_photo(image_file)
+        if not is_sent:
+            await message.answer("No data available for the selected field.")
+    except ChartRendererBusyError as busy_error:
+        logging.warning(str(busy_error))
+        await message.answer(str(busy_error))
     except Exception as exception:
         logging.error(f"Error while sending diagram: {str(exception)}")
         await message.answer(
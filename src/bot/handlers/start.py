@@ -5,7 +5,7 @@ from aiogram.filters import CommandStart
 from aiogram.fsm.context import FSMContext
 from aiogram.types import ReplyKeyboardMarkup, KeyboardButton
 
-from src.models import User
+from src.modules.user.services import UserIdentity
 from src.bot.handlers.company import send_company_options
 
 
@@ -32,7 +32,7 @@ async def start_command_handler(message: types.Message):
 
 
 @router.message(lambda message: message.text == "My Company")
-async def my_company_command_handler(message: types.Message, user: User):
+async def my_company_command_handler(message: types.Message, user: UserIdentity):
     logging.info(f"Handling 'My Company' command from user: {user.id}")
     await send_company_options(user, message)
 
@@ -0,0 +1,82 @@
+import logging
+
+from aiohttp import web
+
+from src.bot.delivery import flood_control_middleware
+from src.bot.scheduler import update_scheduler
+from src.config import settings
+from src.database import async_engine
+from src.metrics import registry
+from src.modules.chart.cache import chart_cache, chart_file_id_cache
+from src.modules.company.services import company_directory_cache
+from src.modules.user.services import user_identity_cache
+
+CACHES = {
+    "user_identity": user_identity_cache,
+    "chart": chart_cache,
+    "chart_file_id": chart_file_id_cache,
+    "company_directory": company_directory_cache,
+}
+
+registry.gauge(
+    "bot_update_scheduler",
+    "Per-chat update scheduler state.",
+    lambda: {
+        (("metric", name),): value
+        for name, value in update_scheduler.get_metrics().items()
+    },
+)
+registry.gauge(
+    "bot_delivery",
+    "Outbound Bot API delivery state.",
+    lambda: {
+        (("metric", name),): value
+        for name, value in flood_control_middleware.get_metrics().items()
+    },
+)
+registry.counter(
+    "cache_hits_total",
+    "Cache hits by cache.",
+    lambda: {(("cache", name),): cache.hits for name, cache in CACHES.items()},
+)
+registry.counter(
+    "cache_misses_total",
+    "Cache misses by cache.",
+    lambda: {(("cache", name),): cache.misses for name, cache in CACHES.items()},
+)
+registry.gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool.",
+    lambda: async_engine.pool.checkedout(),
+)
+
+_runner: web.AppRunner | None = None
+
+
+async def handle_metrics(request: web.Request):
+    return web.Response(
+        text=registry.render(), content_type="text/plain", charset="utf-8"
+    )
+
+
+async def start_metrics_server():
+    global _runner
+
+    application = web.Application()
+    application.router.add_get("/metrics", handle_metrics)
+
+    _runner = web.AppRunner(application)
+    await _runner.setup()
+    await web.TCPSite(_runner, settings.METRICS_HOST, settings.METRICS_PORT).start()
+    logging.info(
+        f"Metrics are served on http://{settings.METRICS_HOST}:{settings.METRICS_PORT}"
+        f"/metrics"
+    )
+
+
+async def stop_metrics_server():
+    global _runner
+
+    if _runner is not None:
+        await _runner.cleanup()
+        _runner = None
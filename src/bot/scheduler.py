@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import time
+from collections import deque
+
+from aiogram import BaseMiddleware, Router
+from aiogram.dispatcher.event.bases import UNHANDLED
+from aiogram.types import ErrorEvent
+
+from src.config import settings
+
+
+class ChatUpdateScheduler(BaseMiddleware):
+    def __init__(
+        self,
+        max_concurrency: int = settings.UPDATE_SCHEDULER_CONCURRENCY,
+        max_pending: int = settings.UPDATE_SCHEDULER_MAX_PENDING,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.pending = 0
+        self.max_pending_seen = 0
+        self.processed = 0
+        self.failed = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self._queues: dict[int, deque] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._capacity = asyncio.Semaphore(max_pending)
+        self._router: Router | None = None
+
+    def setup(self, router: Router):
+        router.update.outer_middleware(self)
+        self._router = router
+
+    async def __call__(self, handler, event, data):
+        chat = data.get("event_chat")
+        user = data.get("event_from_user")
+        key = chat.id if chat else user.id if user else None
+
+        if key is None:
+            return await handler(event, data)
+
+        await self._capacity.acquire()
+        self.pending += 1
+        self.max_pending_seen = max(self.max_pending_seen, self.pending)
+
+        item = (handler, event, data, time.monotonic())
+        queue = self._queues.get(key)
+        if queue is not None:
+            queue.append(item)
+            return
+
+        self._queues[key] = deque([item])
+        task = asyncio.create_task(self._process_chat_updates(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self):
+        if self._tasks:
+            await asyncio.wait(
+                list(self._tasks), timeout=settings.UPDATE_SCHEDULER_SHUTDOWN_TIMEOUT
+            )
+
+    def get_metrics(self):
+        return {
+            "queue_depth": self.pending,
+            "max_queue_depth": self.max_pending_seen,
+            "active_chats": len(self._queues),
+            "processed": self.processed,
+            "failed": self.failed,
+            "average_wait_time": self.total_wait_time / max(self.processed, 1),
+            "max_wait_time": self.max_wait_time,
+        }
+
+    async def _propagate_error(self, key: int, event, data, exception: Exception):
+        # Queued handlers run outside the dispatcher's ErrorsMiddleware, so
+        # hand the failure to its error observers the same way it would.
+        if self._router is not None:
+            try:
+                response = await self._router.propagate_event(
+                    update_type="error",
+                    event=ErrorEvent(update=event, exception=exception),
+                    **data,
+                )
+                if response is not UNHANDLED:
+                    return
+            except Exception as error_handler_exception:
+                exception = error_handler_exception
+
+        logging.error(
+            f"Error while processing update for chat {key}: {str(exception)}",
+            exc_info=exception,
+        )
+
+    async def _process_chat_updates(self, key: int):
+        queue = self._queues[key]
+
+        try:
+            while queue:
+                handler, event, data, enqueued_at = queue[0]
+
+                async with self._slots:
+                    wait_time = time.monotonic() - enqueued_at
+                    self.total_wait_time += wait_time
+                    self.max_wait_time = max(self.max_wait_time, wait_time)
+
+                    try:
+                        state = data.get("state")
+                        if state is not None:
+                            data["raw_state"] = await state.get_state()
+                        await handler(event, data)
+                    except Exception as exception:
+                        self.failed += 1
+                        await self._propagate_error(key, event, data, exception)
+
+                queue.popleft()
+                self.processed += 1
+                self.pending -= 1
+                self._capacity.release()
+        finally:
+            del self._queues[key]
+
+
+update_scheduler = ChatUpdateScheduler()
@@ -0,0 +1,25 @@
+import logging
+import time
+
+STARTED_AT = time.perf_counter()
+
+
+class StartupTimer:
+    def __init__(self):
+        self.imported_in: float | None = None
+        self.first_update_in: float | None = None
+
+    def mark_imported(self):
+        self.imported_in = time.perf_counter() - STARTED_AT
+        logging.info(f"Bot modules were imported in {self.imported_in:.3f}s")
+
+    async def __call__(self, handler, event, data):
+        if self.first_update_in is None:
+            self.first_update_in = time.perf_counter() - STARTED_AT
+            logging.info(
+                f"First update was received {self.first_update_in:.3f}s after start"
+            )
+        return await handler(event, data)
+
+
+startup_timer = StartupTimer()
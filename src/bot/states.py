@@ -14,6 +14,10 @@ class MonthlyCompanyDataForm(StatesGroup):
     kpn = State()
 
 
+class MonthlyCompanyDataImportForm(StatesGroup):
+    document = State()
+
+
 class ViewMonthlyCompanyDataForm(StatesGroup):
     year = State()
     field = State()
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.cache import LRUCache
+from src.config import settings
+from src.database import async_engine, get_dialect_insert
+from src.metrics import fsm_storage_duration
+from src.models import FSMState
+
+
+class DatabaseStorage(BaseStorage):
+    def __init__(
+        self,
+        engine: AsyncEngine = async_engine,
+        flush_interval: float = settings.FSM_STORAGE_FLUSH_INTERVAL,
+        cache_max_entries: int = settings.FSM_STORAGE_CACHE_MAX_ENTRIES,
+    ):
+        self.engine = engine
+        self.flush_interval = flush_interval
+        self._cache = LRUCache(max_entries=cache_max_entries)
+        self._dirty: Dict[str, tuple[Optional[str], Dict[str, Any]]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    @staticmethod
+    def build_key(key: StorageKey):
+        parts = [str(key.bot_id), str(key.chat_id), str(key.user_id)]
+        if key.thread_id:
+            parts.append(str(key.thread_id))
+        if key.business_connection_id:
+            parts.append(key.business_connection_id)
+        parts.append(key.destiny)
+        return ":".join(parts)
+
+    async def setup(self):
+        async with self.engine.begin() as connection:
+            await connection.run_sync(FSMState.__table__.create, checkfirst=True)
+
+    async def set_state(self, key: StorageKey, state: StateType = None):
+        record_key = self.build_key(key)
+        _, data = await self._get_record(record_key)
+        state = state.state if isinstance(state, State) else state
+        self._write_record(record_key, state, data)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        state, _ = await self._get_record(self.build_key(key))
+        return state
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]):
+        record_key = self.build_key(key)
+        state, _ = await self._get_record(record_key)
+        self._write_record(record_key, state, data.copy())
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        _, data = await self._get_record(self.build_key(key))
+        return data.copy()
+
+    async def close(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+    async def flush(self):
+        async with self._flush_lock:
+            if not self._dirty:
+                return
+
+            records, self._dirty = self._dirty, {}
+            try:
+                with fsm_storage_duration.time(operation="flush"):
+                    await self._write_records(records)
+            except BaseException:
+                for record_key, record in records.items():
+                    self._dirty.setdefault(record_key, record)
+                raise
+
+    async def _write_records(self, records):
+        rows = [
+            {"key": record_key, "state": state, "data": data}
+            for record_key, (state, data) in records.items()
+            if state is not None or data
+        ]
+        cleared_keys = [
+            record_key
+            for record_key, (state, data) in records.items()
+            if state is None and not data
+        ]
+
+        async with self.engine.begin() as connection:
+            if rows:
+                insert = get_dialect_insert(self.engine)(FSMState)
+                await connection.execute(
+                    insert.values(rows).on_conflict_do_update(
+                        index_elements=[FSMState.key],
+                        set_={
+                            "state": insert.excluded.state,
+                            "data": insert.excluded.data,
+                        },
+                    )
+                )
+            if cleared_keys:
+                await connection.execute(
+                    delete(FSMState).where(FSMState.key.in_(cleared_keys))
+                )
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as exception:
+                logging.error(f"Error while flushing FSM storage: {str(exception)}")
+
+    async def _get_record(self, record_key: str):
+        record = self._dirty.get(record_key)
+        if record is not None:
+            return record
+
+        record = self._cache.get(record_key)
+        if record is not None:
+            return record
+
+        with fsm_storage_duration.time(operation="load"):
+            async with self.engine.connect() as connection:
+                result = await connection.execute(
+                    select(FSMState.state, FSMState.data).filter_by(key=record_key)
+                )
+                row = result.one_or_none()
+
+        record = (row.state, row.data) if row else (None, {})
+        if record_key not in self._dirty:
+            self._cache.set(record_key, record)
+        return self._dirty.get(record_key, record)
+
+    def _write_record(self, record_key: str, state, data):
+        self._cache.set(record_key, (state, data))
+        self._dirty[record_key] = (state, data)
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+
+def create_fsm_storage():
+    if settings.FSM_STORAGE == "memory":
+        return MemoryStorage()
+
+    if settings.FSM_STORAGE_URL:
+        return DatabaseStorage(engine=create_async_engine(settings.FSM_STORAGE_URL))
+    return DatabaseStorage()
@@ -0,0 +1,113 @@
+import asyncio
+import json
+import logging
+import weakref
+
+from aiohttp import ClientSession, web
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+
+from src.config import settings
+
+WORKER_UPDATE_PATH = "/update"
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+def get_update_chat_id(update: dict):
+    for event in update.values():
+        if not isinstance(event, dict):
+            continue
+
+        for container in (event, event.get("message")):
+            if isinstance(container, dict) and "chat" in container:
+                return container["chat"]["id"]
+
+        if "from" in event:
+            return event["from"]["id"]
+        if "user" in event:
+            return event["user"]["id"]
+
+    return update.get("update_id", 0)
+
+
+def get_worker_url(worker_index: int):
+    port = settings.WEBHOOK_WORKER_BASE_PORT + worker_index
+    return f"http://127.0.0.1:{port}{WORKER_UPDATE_PATH}"
+
+
+def create_router_application(workers: int):
+    application = web.Application()
+    chat_locks = weakref.WeakValueDictionary()
+
+    async def handle_update(request: web.Request):
+        if (
+            settings.WEBHOOK_SECRET
+            and request.headers.get(SECRET_TOKEN_HEADER) != settings.WEBHOOK_SECRET
+        ):
+            return web.Response(status=401)
+
+        payload = await request.read()
+        chat_id = get_update_chat_id(json.loads(payload))
+
+        # Workers acknowledge once the update is queued by the per-chat
+        # scheduler, so this lock is held only for the hand-off. It is still
+        # needed: without it, two updates of one chat are posted over separate
+        # connections and can reach the worker's queue in the wrong order.
+        lock = chat_locks.get(chat_id)
+        if lock is None:
+            lock = chat_locks[chat_id] = asyncio.Lock()
+
+        async with lock:
+            async with application["client_session"].post(
+                get_worker_url(chat_id % workers),
+                data=payload,
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                return web.Response(
+                    status=response.status,
+                    body=await response.read(),
+                    content_type=response.content_type,
+                )
+
+    async def open_client_session(app: web.Application):
+        app["client_session"] = ClientSession()
+        yield
+        await app["client_session"].close()
+
+    application.router.add_post(settings.WEBHOOK_PATH, handle_update)
+    application.cleanup_ctx.append(open_client_session)
+    return application
+
+
+def create_worker_application(dispatcher, bot):
+    application = web.Application()
+
+    SimpleRequestHandler(
+        dispatcher=dispatcher, bot=bot, handle_in_background=False
+    ).register(application, path=WORKER_UPDATE_PATH)
+    setup_application(application, dispatcher, bot=bot)
+
+    return application
+
+
+def run_worker(worker_index: int):
+    settings.METRICS_PORT += worker_index
+    if worker_index:
+        settings.LEADERBOARD_REFRESH_ENABLED = False
+
+    from main import create_bot, dp
+    from src.bot.delivery import flood_control_middleware
+
+    workers = settings.WEBHOOK_WORKERS
+    flood_control_middleware.set_global_rate(
+        settings.DELIVERY_GLOBAL_RATE / workers,
+        max(1.0, settings.DELIVERY_GLOBAL_BURST / workers),
+    )
+
+    logging.info(f"Webhook worker {worker_index} is starting")
+    application = create_worker_application(dp, create_bot())
+    web.run_app(
+        application,
+        host="127.0.0.1",
+        port=settings.WEBHOOK_WORKER_BASE_PORT + worker_index,
+        print=None,
+    )
@@ -0,0 +1,118 @@
+import asyncio
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    def __init__(
+        self,
+        max_entries: int,
+        max_weight: int | None = None,
+        weigher=None,
+        ttl: float | None = None,
+    ):
+        self.max_entries = max_entries
+        self.max_weight = max_weight
+        self.ttl = ttl
+        self.weigher = weigher or (lambda value: 1)
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._loading: dict = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is not None and entry[2] is not None and entry[2] <= time.monotonic():
+            self._remove_entry(key)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key, value, ttl: float | None = None):
+        weight = self.weigher(value)
+        if self.max_weight is not None and weight > self.max_weight:
+            return
+
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        self._remove_entry(key)
+        self._entries[key] = (value, weight, expires_at)
+        self.weight += weight
+        self._evict()
+
+    async def get_or_load(self, key, loader, ttl: float | None = None):
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        future = self._loading.get(key)
+        if future is not None:
+            value = await asyncio.shield(future)
+            if value is _MISSING:
+                return await self.get_or_load(key, loader, ttl)
+            return value
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            # Only the loading task was cancelled: let the waiters load again.
+            if self._loading.get(key) is future:
+                del self._loading[key]
+            future.set_result(_MISSING)
+            raise
+        except Exception as exception:
+            future.set_exception(exception)
+            future.exception()
+            raise
+        else:
+            if self._loading.get(key) is future:
+                self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        finally:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+
+    def invalidate(self, key):
+        self._loading.pop(key, None)
+        self._remove_entry(key)
+
+    def invalidate_where(self, predicate):
+        keys = [key for key in (*self._entries, *self._loading) if predicate(key)]
+        for key in keys:
+            self.invalidate(key)
+
+    def clear(self):
+        self._loading.clear()
+        self._entries.clear()
+        self.weight = 0
+
+    def _remove_entry(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.weight -= entry[1]
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries or (
+            self.max_weight is not None and self.weight > self.max_weight
+        ):
+            _, (_, weight, _) = self._entries.popitem(last=False)
+            self.weight -= weight
@@ -10,8 +10,60 @@ class Settings(BaseSettings):
     DB_USER: str
     DB_PASS: str
     DB_NAME: str
+    DATABASE_URL: str | None = None
     DATABASE_ECHO: bool = True
     TELEGRAM_BOT_TOKEN: str
+    TELEGRAM_API_URL: str | None = None
+    WEBHOOK_BASE_URL: str | None = None
+    WEBHOOK_PATH: str = "/webhook"
+    WEBHOOK_SECRET: str | None = None
+    WEBHOOK_HOST: str = "0.0.0.0"
+    WEBHOOK_PORT: int = 8080
+    WEBHOOK_WORKERS: int = 2
+    WEBHOOK_WORKER_BASE_PORT: int = 8081
+    WEBHOOK_MAX_CONNECTIONS: int = 40
+    CHART_RENDERER: str = "matplotlib"
+    CHART_RENDER_WORKERS: int = 2
+    CHART_RENDER_QUEUE_SIZE: int = 16
+    CHART_RENDER_QUEUE_TIMEOUT: float = 10.0
+    CHART_CACHE_MAX_ENTRIES: int = 512
+    CHART_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    CHART_FILE_ID_CACHE_MAX_ENTRIES: int = 4096
+    COMPANY_LIST_PAGE_SIZE: int = 10
+    COMPANY_CACHE_MAX_ENTRIES: int = 10000
+    COMPANY_LIST_CACHE_TTL: float = 60.0
+    COMPANY_YEARS_CACHE_TTL: float = 600.0
+    COMPANY_NAME_CACHE_TTL: float = 600.0
+    IMPORT_BATCH_SIZE: int = 500
+    IMPORT_MAX_FILE_SIZE: int = 10 * 1024 * 1024
+    IMPORT_MAX_REPORTED_ERRORS: int = 20
+    EXPORT_PARTITION_SIZE: int = 1000
+    EXPORT_SPOOL_MAX_SIZE: int = 1024 * 1024
+    UPDATE_SCHEDULER_CONCURRENCY: int = 64
+    UPDATE_SCHEDULER_MAX_PENDING: int = 1000
+    UPDATE_SCHEDULER_SHUTDOWN_TIMEOUT: float = 10.0
+    DELIVERY_GLOBAL_RATE: float = 30.0
+    DELIVERY_GLOBAL_BURST: float = 30.0
+    DELIVERY_CHAT_RATE: float = 1.0
+    DELIVERY_CHAT_BURST: float = 3.0
+    DELIVERY_GROUP_RATE: float = 20 / 60
+    DELIVERY_GROUP_BURST: float = 5.0
+    DELIVERY_MAX_RETRIES: int = 3
+    DELIVERY_MAX_TRACKED_CHATS: int = 100000
+    BROADCAST_CONCURRENCY: int = 20
+    BROADCAST_PARTITION_SIZE: int = 500
+    METRICS_ENABLED: bool = True
+    METRICS_HOST: str = "127.0.0.1"
+    METRICS_PORT: int = 9100
+    LEADERBOARD_PAGE_SIZE: int = 10
+    LEADERBOARD_REFRESH_INTERVAL: float = 300.0
+    LEADERBOARD_REFRESH_ENABLED: bool = True
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    USER_CACHE_TTL: float = 300.0
+    FSM_STORAGE: str = "database"
+    FSM_STORAGE_URL: str | None = None
+    FSM_STORAGE_FLUSH_INTERVAL: float = 1.0
+    FSM_STORAGE_CACHE_MAX_ENTRIES: int = 10000
 
     @property
     def DATABASE_URL_asyncpg(self):
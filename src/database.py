@@ -1,11 +1,58 @@
+import time
+
+from sqlalchemy import Select, event
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.config import settings
+from src.metrics import db_pool_checkout_wait, db_statement_duration
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_wait.observe(time.perf_counter() - started_at)
+
+
+def instrument_engine(engine):
+    def observe_statement(connection, statement):
+        started_at = connection.info.pop("statement_started_at", None)
+        if started_at is None or statement is None:
+            return
+
+        db_statement_duration.observe(
+            time.perf_counter() - started_at,
+            statement=statement.lstrip().split(None, 1)[0].upper(),
+        )
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(connection, cursor, statement, *args):
+        connection.info["statement_started_at"] = time.perf_counter()
 
-async_engine = create_async_engine(
-    url=settings.DATABASE_URL_asyncpg,
-    echo=False,
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(connection, cursor, statement, *args):
+        observe_statement(connection, statement)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(exception_context):
+        if exception_context.connection is not None:
+            observe_statement(exception_context.connection, exception_context.statement)
+
+    return engine
+
+
+async_engine = instrument_engine(
+    create_async_engine(
+        url=settings.DATABASE_URL or settings.DATABASE_URL_asyncpg,
+        echo=False,
+        poolclass=InstrumentedQueuePool,
+    )
 )
 
 async_session_factory = async_sessionmaker(
@@ -21,5 +68,70 @@ async def get_db_session() -> AsyncSession:
         yield session
 
 
+class LazySession:
+    def __init__(self, session_factory=async_session_factory):
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+        self._has_pending_writes = False
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    async def execute(self, statement, *args, **kwargs):
+        result = await self.session.execute(statement, *args, **kwargs)
+        await self._release_after_read(statement)
+        return result
+
+    async def scalar(self, statement, *args, **kwargs):
+        result = await self.session.scalar(statement, *args, **kwargs)
+        await self._release_after_read(statement)
+        return result
+
+    async def scalars(self, statement, *args, **kwargs):
+        result = await self.session.scalars(statement, *args, **kwargs)
+        await self._release_after_read(statement)
+        return result
+
+    async def commit(self):
+        await self.session.commit()
+        self._has_pending_writes = False
+
+    async def rollback(self):
+        await self.session.rollback()
+        self._has_pending_writes = False
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._has_pending_writes = False
+
+    async def _release_after_read(self, statement):
+        session = self._session
+        if not isinstance(statement, Select):
+            self._has_pending_writes = True
+            return
+
+        if self._has_pending_writes:
+            return
+
+        if session.new or session.dirty or session.deleted:
+            return
+
+        await session.commit()
+
+
+def get_dialect_insert(engine=async_engine):
+    if engine.dialect.name == "sqlite":
+        return sqlite_insert
+    return postgresql_insert
+
+
 class Base(DeclarativeBase):
     pass
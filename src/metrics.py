@@ -0,0 +1,143 @@
+import bisect
+import time
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def escape_label_value(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: dict):
+    if not labels:
+        return ""
+
+    pairs = ",".join(
+        f'{name}="{escape_label_value(value)}"' for name, value in labels.items()
+    )
+    return f"{{{pairs}}}"
+
+
+class Histogram:
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series[0][index] += 1
+        series[1] += value
+        series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at, **labels)
+
+    def collect(self):
+        for key, (bucket_counts, total, count) in self._series.items():
+            labels = dict(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket", {**labels, "le": str(bound)}, cumulative
+            yield f"{self.name}_bucket", {**labels, "le": "+Inf"}, count
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+class Gauge:
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, collect_function):
+        self.name = name
+        self.documentation = documentation
+        self.collect_function = collect_function
+
+    def collect(self):
+        values = self.collect_function()
+        if not isinstance(values, dict):
+            values = {(): values}
+
+        for key, value in values.items():
+            yield self.name, dict(key), value
+
+
+class Counter(Gauge):
+    type = "counter"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics = []
+
+    def histogram(self, name: str, documentation: str, buckets=DEFAULT_BUCKETS):
+        metric = Histogram(name, documentation, buckets)
+        self.metrics.append(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, collect_function):
+        metric = Gauge(name, documentation, collect_function)
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, collect_function):
+        metric = Counter(name, documentation, collect_function)
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.collect():
+                lines.append(f"{name}{format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+handler_duration = registry.histogram(
+    "bot_handler_duration_seconds", "Time spent in update handlers."
+)
+db_statement_duration = registry.histogram(
+    "db_statement_duration_seconds", "Time spent executing SQL statements."
+)
+db_pool_checkout_wait = registry.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection."
+)
+chart_render_duration = registry.histogram(
+    "chart_render_duration_seconds", "Time spent rendering charts."
+)
+fsm_storage_duration = registry.histogram(
+    "fsm_storage_duration_seconds", "Time spent in FSM storage database calls."
+)
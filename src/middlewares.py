@@ -1,16 +1,29 @@
 from aiogram import BaseMiddleware
 from sqlalchemy.orm import session
 
-from src.modules.user.services import create_user
-from src.modules.user.queries import get_user_query
-from src.database import get_db_session
+from src.modules.user.services import get_or_create_user, user_identity_cache
+from src.database import LazySession
+from src.metrics import handler_duration
+
+
+class MetricsMiddleware(BaseMiddleware):
+    async def __call__(self, handler, event, data):
+        handler_object = data.get("handler")
+        handler_name = handler_object.callback.__name__ if handler_object else "unknown"
+
+        with handler_duration.time(handler=handler_name):
+            return await handler(event, data)
 
 
 class SessionMiddleware(BaseMiddleware):
     async def __call__(self, handler, event, data):
-        async for session in get_db_session():
-            data["session"] = session
+        session = LazySession()
+        data["session"] = session
+
+        try:
             return await handler(event, data)
+        finally:
+            await session.close()
 
 
 class UserMiddleware(BaseMiddleware):
@@ -19,15 +32,18 @@ class UserMiddleware(BaseMiddleware):
 
         if hasattr(event, "from_user") and session:
             user_id = event.from_user.id
-            user_result = await session.execute(get_user_query(user_id))
-            user = user_result.scalar_one_or_none()
+            user = user_identity_cache.get(user_id)
 
             if user is None:
-                user = await create_user(user_id, event.from_user.full_name, session)
+                user = await get_or_create_user(
+                    user_id, event.from_user.full_name, session
+                )
+                user_identity_cache.set(user_id, user)
 
             data["user"] = user
             return await handler(event, data)
 
 
+metrics_middleware = MetricsMiddleware()
 session_middleware = SessionMiddleware()
 user_middleware = UserMiddleware()
@@ -13,6 +13,10 @@ from sqlalchemy import (
     String,
     Date,
     UniqueConstraint,
+    JSON,
+    SmallInteger,
+    Index,
+    BigInteger,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing_extensions import Annotated
@@ -20,18 +24,16 @@ from typing_extensions import Annotated
 from src.database import Base
 
 
-positive_integer_field = Annotated[
-    int, mapped_column(Integer, CheckConstraint("value >= 0"), default=0)
-]
+positive_integer_field = Annotated[int, mapped_column(Integer, default=0)]
 created_at = Annotated[
     datetime.datetime,
-    mapped_column(Date, server_default=text("TIMEZONE('utc', now())")),
+    mapped_column(Date, server_default=text("(TIMEZONE('utc', now()))")),
 ]
 updated_at = Annotated[
     datetime.datetime,
     mapped_column(
         Date,
-        server_default=text("TIMEZONE('utc', now())"),
+        server_default=text("(TIMEZONE('utc', now()))"),
         onupdate=datetime.datetime.utcnow,
     ),
 ]
@@ -52,11 +54,15 @@ class MonthEnum(enum.Enum):
     DECEMBER = "December"
 
 
+MONTH_NUMBERS = {month.value: number for number, month in enumerate(MonthEnum, 1)}
+MONTH_NAMES = {number: month for month, number in MONTH_NUMBERS.items()}
+
+
 class User(Base):
     __tablename__ = "users"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    username: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+    username: Mapped[str] = mapped_column(String, nullable=False)
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False)
 
     company: Mapped["Company"] = relationship(back_populates="user", uselist=False)
@@ -68,6 +74,14 @@ class MonthlyCompanyData(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     year: Mapped[int] = mapped_column(Integer, nullable=False)
     month: Mapped[MonthEnum] = mapped_column(String, Enum(MonthEnum), nullable=False)
+    month_number: Mapped[int] = mapped_column(
+        SmallInteger,
+        CheckConstraint(
+            "month_number BETWEEN 1 AND 12",
+            name="ck_monthly_companies_data_month_number",
+        ),
+        nullable=False,
+    )
     income: Mapped[positive_integer_field]
     expenses: Mapped[positive_integer_field]
     profit: Mapped[positive_integer_field]
@@ -83,6 +97,19 @@ class MonthlyCompanyData(Base):
         UniqueConstraint(
             "year", "month", "company_id", name="uix_company_month_year_data"
         ),
+        Index(
+            "ix_monthly_companies_data_company_year_month",
+            "company_id",
+            "year",
+            "month_number",
+            postgresql_include=["income", "expenses", "profit", "kpn"],
+        ),
+        *(
+            CheckConstraint(
+                f"{field} >= 0", name=f"ck_monthly_companies_data_{field}_positive"
+            )
+            for field in ("income", "expenses", "profit", "kpn")
+        ),
     )
 
 
@@ -93,8 +120,50 @@ class Company(Base):
     name: Mapped[str] = mapped_column(String, nullable=False, unique=True)
     created_at: Mapped[created_at]
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), unique=True)
+    data_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
 
     user: Mapped["User"] = relationship(back_populates="company")
     monthly_data_set: Mapped[List["MonthlyCompanyData"]] = relationship(
         back_populates="company", cascade="all, delete-orphan", uselist=True
     )
+
+
+class FSMState(Base):
+    __tablename__ = "fsm_states"
+
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    state: Mapped[str | None] = mapped_column(String, nullable=True)
+    data: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+
+
+class Broadcast(Base):
+    __tablename__ = "broadcasts"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    text: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str] = mapped_column(String, nullable=False, default="pending")
+    last_user_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    sent: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_by: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
+    created_at: Mapped[created_at]
+
+
+class CompanyYearlyTotals(Base):
+    __tablename__ = "company_yearly_totals"
+
+    company_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True
+    )
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    income: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    profit: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    income_rank: Mapped[int] = mapped_column(Integer, nullable=False)
+    profit_rank: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_company_yearly_totals_year_income_rank", "year", "income_rank"),
+        Index("ix_company_yearly_totals_year_profit_rank", "year", "profit_rank"),
+    )
@@ -0,0 +1,24 @@
+from sqlalchemy import select, update
+
+from src.models import Broadcast, User
+
+
+def get_broadcast_by_id_query(broadcast_id: int):
+    return select(Broadcast).filter_by(id=broadcast_id)
+
+
+def get_broadcast_recipients_query(after_user_id: int | None, partition_size: int):
+    query = select(User.id).order_by(User.id)
+    if after_user_id is not None:
+        query = query.where(User.id > after_user_id)
+    return query.limit(partition_size)
+
+
+def update_broadcast_progress_query(
+    broadcast_id: int, last_user_id: int | None, sent: int, failed: int, status: str
+):
+    return (
+        update(Broadcast)
+        .filter_by(id=broadcast_id)
+        .values(last_user_id=last_user_id, sent=sent, failed=failed, status=status)
+    )
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.bot.delivery import BULK_PRIORITY, delivery_priority
+from src.config import settings
+from src.database import async_session_factory
+from src.models import Broadcast
+from src.modules.broadcast.queries import (
+    get_broadcast_by_id_query,
+    get_broadcast_recipients_query,
+    update_broadcast_progress_query,
+)
+
+running_broadcasts: dict[int, asyncio.Task] = {}
+
+
+async def create_broadcast(text: str, admin_id: int, session: AsyncSession):
+    instance = Broadcast(text=text, created_by=admin_id, status="pending")
+
+    session.add(instance)
+    await session.commit()
+
+    await session.refresh(instance)
+    return instance
+
+
+async def get_or_none_broadcast_by_id(broadcast_id: int, session: AsyncSession):
+    instance = await session.execute(get_broadcast_by_id_query(broadcast_id))
+    return instance.scalar_one_or_none()
+
+
+async def save_broadcast_progress(broadcast: Broadcast, status: str):
+    broadcast.status = status
+    async with async_session_factory() as session:
+        await session.execute(
+            update_broadcast_progress_query(
+                broadcast.id,
+                broadcast.last_user_id,
+                broadcast.sent,
+                broadcast.failed,
+                status,
+            )
+        )
+        await session.commit()
+
+
+async def get_broadcast_recipients(after_user_id: int | None, partition_size: int):
+    async with async_session_factory() as session:
+        recipients = await session.scalars(
+            get_broadcast_recipients_query(after_user_id, partition_size)
+        )
+        return recipients.all()
+
+
+async def send_broadcast_message(bot: Bot, user_id: int, text: str):
+    try:
+        await bot.send_message(user_id, text)
+        return True
+    except TelegramAPIError as api_error:
+        logging.info(f"Broadcast to {user_id} failed: {str(api_error)}")
+        return False
+
+
+def record_broadcast_batch(broadcast: Broadcast, user_ids, tasks):
+    for user_id, task in zip(user_ids, tasks):
+        if not task.done() or task.cancelled() or task.exception() is not None:
+            break
+
+        if task.result():
+            broadcast.sent += 1
+        else:
+            broadcast.failed += 1
+        broadcast.last_user_id = user_id
+
+
+async def run_broadcast(bot: Bot, broadcast: Broadcast, report_progress):
+    delivery_priority.set(BULK_PRIORITY)
+    batch_size = settings.BROADCAST_CONCURRENCY
+    partition_size = settings.BROADCAST_PARTITION_SIZE
+
+    await save_broadcast_progress(broadcast, "running")
+    try:
+        while True:
+            user_ids = await get_broadcast_recipients(
+                broadcast.last_user_id, partition_size
+            )
+            if not user_ids:
+                break
+
+            # Progress is saved after every batch, so a crash re-sends at most
+            # the batch that was in flight and a stop only the unfinished sends.
+            for index in range(0, len(user_ids), batch_size):
+                batch = user_ids[index : index + batch_size]
+                tasks = [
+                    asyncio.ensure_future(
+                        send_broadcast_message(bot, user_id, broadcast.text)
+                    )
+                    for user_id in batch
+                ]
+                try:
+                    await asyncio.gather(*tasks)
+                finally:
+                    record_broadcast_batch(broadcast, batch, tasks)
+                await save_broadcast_progress(broadcast, "running")
+            await report_progress(broadcast)
+    except asyncio.CancelledError:
+        await save_broadcast_progress(broadcast, "paused")
+        raise
+    except Exception as exception:
+        logging.error(f"Broadcast {broadcast.id} failed: {str(exception)}")
+        await save_broadcast_progress(broadcast, "failed")
+        await report_progress(broadcast)
+        return
+
+    await save_broadcast_progress(broadcast, "completed")
+    await report_progress(broadcast)
+
+
+def start_broadcast(bot: Bot, broadcast: Broadcast, report_progress):
+    task = asyncio.create_task(run_broadcast(bot, broadcast, report_progress))
+    running_broadcasts[broadcast.id] = task
+    task.add_done_callback(lambda _: running_broadcasts.pop(broadcast.id, None))
+    return task
+
+
+def stop_broadcast(broadcast_id: int):
+    task = running_broadcasts.get(broadcast_id)
+    if task is None:
+        return False
+
+    task.cancel()
+    return True
@@ -0,0 +1,21 @@
+from src.cache import LRUCache
+from src.config import settings
+
+chart_cache = LRUCache(
+    max_entries=settings.CHART_CACHE_MAX_ENTRIES,
+    max_weight=settings.CHART_CACHE_MAX_BYTES,
+    weigher=len,
+)
+
+chart_file_id_cache = LRUCache(max_entries=settings.CHART_FILE_ID_CACHE_MAX_ENTRIES)
+
+
+def evict_company_charts(company_id: int):
+    chart_cache.invalidate_where(lambda key: key[0] == company_id)
+    chart_file_id_cache.invalidate_where(lambda key: key[0] == company_id)
+
+
+def get_chart_cache_key(
+    company_id: int, selected_year: int, selected_field: str, data_version: int
+):
+    return (company_id, selected_year, selected_field, data_version)
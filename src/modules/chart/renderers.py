@@ -0,0 +1,143 @@
+import io
+import math
+import sys
+
+PILLOW_CHART_SIZE = (1000, 600)
+PILLOW_CHART_MARGINS = (90, 60, 30, 60)
+PILLOW_CHART_PALETTE = (255, 255, 255, 0, 0, 0, 0, 0, 255, 215, 215, 215)
+WHITE, BLACK, BLUE, GRAY = range(4)
+
+
+def import_pyplot():
+    if "matplotlib.pyplot" not in sys.modules:
+        import matplotlib
+
+        matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def init_chart_render_worker(renderer: str = "matplotlib"):
+    if renderer == "pillow":
+        from PIL import Image, ImageDraw, ImageFont  # noqa: F401
+    else:
+        import_pyplot()
+
+
+def ping_chart_render_worker():
+    return True
+
+
+def render_monthly_data_chart(values, months, selected_field, selected_year):
+    plt = import_pyplot()
+
+    plt.figure(figsize=(10, 6))
+    plt.bar(months, values, color="blue")
+    plt.xlabel("MONTH")
+    plt.ylabel(selected_field.upper())
+    plt.title(f"{selected_field.upper()} for {selected_year}")
+
+    image_stream = io.BytesIO()
+    plt.savefig(image_stream, format="png")
+    plt.close()
+
+    return image_stream.getvalue()
+
+
+def render_monthly_data_dashboard(months, series, selected_year):
+    plt = import_pyplot()
+
+    figure, axes = plt.subplots(2, 2, figsize=(14, 9), sharex=True)
+    for axis, (field, values) in zip(axes.flat, series.items()):
+        axis.bar(months, values, color="blue")
+        axis.set_title(field.upper())
+        axis.tick_params(axis="x", labelrotation=45)
+
+    figure.suptitle(f"Dashboard for {selected_year}")
+    figure.tight_layout()
+
+    image_stream = io.BytesIO()
+    figure.savefig(image_stream, format="png")
+    plt.close(figure)
+
+    return image_stream.getvalue()
+
+
+def get_axis_step(max_value, ticks: int = 5):
+    if max_value <= 0:
+        return 1
+
+    raw_step = max_value / ticks
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    for multiplier in (1, 2, 5, 10):
+        if raw_step <= multiplier * magnitude:
+            return multiplier * magnitude
+
+
+def format_axis_value(value):
+    for divisor, suffix in ((1e9, "B"), (1e6, "M"), (1e3, "k")):
+        if value >= divisor:
+            return f"{value / divisor:g}{suffix}"
+    return f"{value:g}"
+
+
+def draw_text(draw, position, text, font, anchor_x=0.5, anchor_y=0.5):
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    x, y = position
+    draw.text(
+        (x - (right - left) * anchor_x - left, y - (bottom - top) * anchor_y - top),
+        text,
+        fill=BLACK,
+        font=font,
+    )
+
+
+def render_monthly_data_chart_with_pillow(
+    values, months, selected_field, selected_year
+):
+    from PIL import Image, ImageDraw, ImageFont
+
+    width, height = PILLOW_CHART_SIZE
+    left, top, right, bottom = PILLOW_CHART_MARGINS
+    plot_width = width - left - right
+    plot_height = height - top - bottom
+    baseline = top + plot_height
+
+    image = Image.new("P", PILLOW_CHART_SIZE, WHITE)
+    image.putpalette(PILLOW_CHART_PALETTE)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default()
+
+    max_value = max(values, default=0)
+    step = get_axis_step(max_value)
+    tick_count = max(1, math.ceil(max_value / step))
+    scale = plot_height / (tick_count * step)
+
+    for index in range(tick_count + 1):
+        tick = index * step
+        y = baseline - tick * scale
+        draw.line((left, y, width - right, y), fill=GRAY)
+        draw_text(draw, (left - 8, y), format_axis_value(tick), font, anchor_x=1)
+
+    slot_width = plot_width / max(len(values), 1)
+    bar_width = slot_width * 0.8
+    for index, (value, month) in enumerate(zip(values, months)):
+        x = left + slot_width * (index + 0.5)
+        draw.rectangle(
+            (x - bar_width / 2, baseline - value * scale, x + bar_width / 2, baseline),
+            fill=BLUE,
+        )
+        draw_text(draw, (x, baseline + 8), month, font, anchor_y=0)
+
+    draw.line((left, top, left, baseline), fill=BLACK)
+    draw.line((left, baseline, width - right, baseline), fill=BLACK)
+    title = f"{selected_field.upper()} for {selected_year}"
+    draw_text(draw, (width / 2, top / 3), title, font)
+    draw_text(draw, (left, top * 2 / 3), selected_field.upper(), font, anchor_x=0)
+    draw_text(draw, (left + plot_width / 2, height - bottom / 3), "MONTH", font)
+
+    image_stream = io.BytesIO()
+    image.save(image_stream, format="PNG")
+    return image_stream.getvalue()
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.metrics import chart_render_duration
+from src.models import MONTH_NAMES
+from src.modules.chart.cache import chart_cache, get_chart_cache_key
+from src.modules.chart.renderers import (
+    init_chart_render_worker,
+    ping_chart_render_worker,
+    render_monthly_data_chart,
+    render_monthly_data_chart_with_pillow,
+    render_monthly_data_dashboard,
+)
+from src.modules.company.services import (
+    get_data_for_the_selected_year,
+    get_data_for_the_selected_year_and_attribute,
+)
+
+DASHBOARD_FIELD = "dashboard"
+MONTHLY_DATA_FIELDS = ("income", "expenses", "profit", "kpn")
+MONTHLY_DATA_CHART_RENDERERS = {
+    "matplotlib": render_monthly_data_chart,
+    "pillow": render_monthly_data_chart_with_pillow,
+}
+
+
+class ChartRendererBusyError(Exception):
+    pass
+
+
+_executor: ProcessPoolExecutor | None = None
+_slots: asyncio.Semaphore | None = None
+_warm_up_task: asyncio.Task | None = None
+
+
+def get_chart_render_executor():
+    global _executor, _slots
+
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.CHART_RENDER_WORKERS,
+            initializer=init_chart_render_worker,
+            initargs=(settings.CHART_RENDERER,),
+        )
+        _slots = asyncio.Semaphore(
+            settings.CHART_RENDER_WORKERS + settings.CHART_RENDER_QUEUE_SIZE
+        )
+    return _executor
+
+
+async def warm_up_chart_renderer(executor: ProcessPoolExecutor):
+    loop = asyncio.get_running_loop()
+
+    # Idle workers are reused, so submitting the pings together makes the
+    # pool start (and run the initializer in) every worker up front.
+    await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, ping_chart_render_worker)
+            for _ in range(settings.CHART_RENDER_WORKERS)
+        )
+    )
+    logging.info(
+        f"Chart renderer is ready with {settings.CHART_RENDER_WORKERS} workers"
+    )
+
+
+async def start_chart_renderer():
+    global _warm_up_task
+
+    executor = get_chart_render_executor()
+    _warm_up_task = asyncio.create_task(warm_up_chart_renderer(executor))
+
+
+async def stop_chart_renderer():
+    global _executor, _slots, _warm_up_task
+
+    if _warm_up_task is not None:
+        _warm_up_task.cancel()
+        _warm_up_task = None
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        _slots = None
+
+
+async def render_chart(render_function, *args):
+    executor = get_chart_render_executor()
+    slots = _slots
+
+    try:
+        await asyncio.wait_for(
+            slots.acquire(), timeout=settings.CHART_RENDER_QUEUE_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        raise ChartRendererBusyError(
+            "Too many charts are being generated right now. Please try again later."
+        )
+
+    try:
+        loop = asyncio.get_running_loop()
+        with chart_render_duration.time(renderer=render_function.__name__):
+            return await loop.run_in_executor(executor, render_function, *args)
+    finally:
+        slots.release()
+
+
+async def generate_monthly_data_chart_based_on_company_records(
+    records, selected_field, selected_year
+):
+    values = [record[0] for record in records]
+    months = [MONTH_NAMES[record[1]] for record in records]
+
+    render_function = MONTHLY_DATA_CHART_RENDERERS[settings.CHART_RENDERER]
+    return await render_chart(
+        render_function, values, months, selected_field, selected_year
+    )
+
+
+async def generate_monthly_data_dashboard_based_on_company_records(
+    records, selected_year
+):
+    months = [MONTH_NAMES[record[0]] for record in records]
+    series = {
+        field: [record[index] for record in records]
+        for index, field in enumerate(MONTHLY_DATA_FIELDS, 1)
+    }
+
+    return await render_chart(
+        render_monthly_data_dashboard, months, series, selected_year
+    )
+
+
+def get_records_for_field(year_records, selected_field: str):
+    index = MONTHLY_DATA_FIELDS.index(selected_field) + 1
+    return [(record[index], record[0]) for record in year_records]
+
+
+async def get_monthly_data_chart(
+    company_id: int,
+    selected_field: str,
+    selected_year: int,
+    session: AsyncSession,
+    data_version: int,
+    year_records=None,
+):
+    cache_key = get_chart_cache_key(
+        company_id, selected_year, selected_field, data_version
+    )
+    image_bytes = chart_cache.get(cache_key)
+    if image_bytes is not None:
+        return image_bytes
+
+    if selected_field == DASHBOARD_FIELD:
+        records = year_records
+        if records is None:
+            records = await get_data_for_the_selected_year(
+                company_id, selected_year, session
+            )
+        if not records:
+            return None
+
+        image_bytes = await generate_monthly_data_dashboard_based_on_company_records(
+            records, selected_year
+        )
+    else:
+        if year_records is not None:
+            records = get_records_for_field(year_records, selected_field)
+        else:
+            records = await get_data_for_the_selected_year_and_attribute(
+                company_id, selected_field, selected_year, session
+            )
+        if not records:
+            return None
+
+        image_bytes = await generate_monthly_data_chart_based_on_company_records(
+            records, selected_field, selected_year
+        )
+    chart_cache.set(cache_key, image_bytes)
+    return image_bytes
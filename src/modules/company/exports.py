@@ -0,0 +1,55 @@
+import csv
+import io
+import tempfile
+
+from aiogram.types import InputFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.modules.company.imports import IMPORT_COLUMNS
+from src.modules.company.queries import get_monthly_data_export_query
+
+
+class SpooledInputFile(InputFile):
+    def __init__(self, file, filename: str, **kwargs):
+        super().__init__(filename=filename, **kwargs)
+        self.file = file
+
+    async def read(self, bot):
+        self.file.seek(0)
+        while chunk := self.file.read(self.chunk_size):
+            yield chunk
+
+
+def create_export_file():
+    return tempfile.SpooledTemporaryFile(max_size=settings.EXPORT_SPOOL_MAX_SIZE)
+
+
+async def export_monthly_company_information(
+    file, session: AsyncSession, company_id: int | None = None
+):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def write_buffer():
+        file.write(buffer.getvalue().encode("utf-8"))
+        buffer.seek(0)
+        buffer.truncate()
+
+    header = IMPORT_COLUMNS if company_id is not None else ("company", *IMPORT_COLUMNS)
+    writer.writerow(header)
+
+    exported_count = 0
+    result = await session.stream(
+        get_monthly_data_export_query(company_id, settings.EXPORT_PARTITION_SIZE)
+    )
+    try:
+        async for partition in result.partitions():
+            writer.writerows(partition)
+            write_buffer()
+            exported_count += len(partition)
+    finally:
+        await result.close()
+
+    write_buffer()
+    return exported_count
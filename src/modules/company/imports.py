@@ -0,0 +1,111 @@
+import asyncio
+import csv
+import io
+import itertools
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models import Company
+from src.modules.company.services import (
+    bulk_upsert_monthly_company_information,
+    invalidate_company_data,
+)
+from src.modules.company.validations import company_information_row_validation
+
+IMPORT_COLUMNS = ("year", "month", "income", "expenses", "profit", "kpn")
+
+
+class UnsupportedImportFileError(Exception):
+    pass
+
+
+def normalize_header(header):
+    return [str(column or "").strip().lower() for column in header]
+
+
+def iter_csv_rows(file):
+    text_file = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text_file)
+
+    header = normalize_header(next(reader, []))
+    for line_number, values in enumerate(reader, start=2):
+        if any(values):
+            yield line_number, dict(zip(header, values))
+
+
+def iter_xlsx_rows(file):
+    try:
+        import openpyxl
+    except ImportError:
+        raise UnsupportedImportFileError(
+            "XLSX import is not available. Please upload a CSV file."
+        )
+
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+
+        header = normalize_header(next(rows, []))
+        for line_number, values in enumerate(rows, start=2):
+            if any(value is not None for value in values):
+                yield line_number, dict(zip(header, values))
+    finally:
+        workbook.close()
+
+
+def iter_import_rows(file, file_name: str):
+    file_name = (file_name or "").lower()
+
+    if file_name.endswith(".csv"):
+        return iter_csv_rows(file)
+    if file_name.endswith(".xlsx"):
+        return iter_xlsx_rows(file)
+
+    raise UnsupportedImportFileError("Please upload a .csv or .xlsx file.")
+
+
+def parse_monthly_company_information(rows, batch_size: int):
+    parsed_rows = {}
+    errors = []
+
+    for line_number, row in itertools.islice(rows, batch_size):
+        is_valid, content = company_information_row_validation(row)
+        if not is_valid:
+            errors.append((line_number, content))
+            continue
+
+        parsed_rows[(content["year"], content["month"])] = content
+
+    return list(parsed_rows.values()), errors, bool(parsed_rows or errors)
+
+
+async def import_monthly_company_information(
+    file, file_name: str, company: Company, session: AsyncSession
+):
+    rows = iter_import_rows(file, file_name)
+    imported_count = 0
+    errors = []
+
+    # Parse and validate one batch at a time off the event loop, writing
+    # each batch before the next is read.
+    try:
+        while True:
+            batch, batch_errors, has_rows = await asyncio.to_thread(
+                parse_monthly_company_information, rows, settings.IMPORT_BATCH_SIZE
+            )
+            if not has_rows:
+                break
+
+            errors.extend(batch_errors)
+            if batch:
+                await bulk_upsert_monthly_company_information(batch, company, session)
+                imported_count += len(batch)
+    finally:
+        rows.close()
+
+    await session.commit()
+
+    if imported_count:
+        invalidate_company_data(company.id)
+    return imported_count, errors
@@ -1,22 +1,89 @@
-from sqlalchemy import select
+from sqlalchemy import delete, exists, select, update
+from sqlalchemy.orm import aliased
 
-from src.models import Company, MonthlyCompanyData
+from src.database import get_dialect_insert
+from src.models import Company, MonthlyCompanyData, MONTH_NUMBERS
 
 
-def get_company_list_query():
-    return select(Company.name).join(MonthlyCompanyData).distinct()
+def get_company_list_query(
+    page_size: int,
+    after_company_id: int | None = None,
+    before_company_id: int | None = None,
+):
+    cursor_company = aliased(Company)
+    query = select(Company.id, Company.name).where(
+        exists().where(MonthlyCompanyData.company_id == Company.id)
+    )
+
+    if before_company_id is not None:
+        cursor_name = (
+            select(cursor_company.name)
+            .filter_by(id=before_company_id)
+            .scalar_subquery()
+        )
+        query = query.where(Company.name < cursor_name).order_by(Company.name.desc())
+    elif after_company_id is not None:
+        cursor_name = (
+            select(cursor_company.name).filter_by(id=after_company_id).scalar_subquery()
+        )
+        query = query.where(Company.name > cursor_name).order_by(Company.name)
+    else:
+        query = query.order_by(Company.name)
+
+    return query.limit(page_size + 1)
 
 
 def get_company_by_name_query(name: str):
     return select(Company).filter_by(name=name)
 
 
+def delete_company_query(company_id: int):
+    return delete(Company).filter_by(id=company_id)
+
+
 def get_monthly_company_information_query(company_id: int, year: int, month: str):
     return select(MonthlyCompanyData).filter_by(
         company_id=company_id, year=year, month=month
     )
 
 
+def bulk_upsert_monthly_company_information_query(company_id: int, rows):
+    statement = get_dialect_insert()(MonthlyCompanyData).values(
+        [
+            {
+                "company_id": company_id,
+                "year": row["year"],
+                "month": row["month"],
+                "month_number": MONTH_NUMBERS[row["month"]],
+                "income": row["income"],
+                "expenses": row["expenses"],
+                "profit": row["profit"],
+                "kpn": row["kpn"],
+            }
+            for row in rows
+        ]
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[
+            MonthlyCompanyData.year,
+            MonthlyCompanyData.month,
+            MonthlyCompanyData.company_id,
+        ],
+        set_={
+            "income": statement.excluded.income,
+            "expenses": statement.excluded.expenses,
+            "profit": statement.excluded.profit,
+            "kpn": statement.excluded.kpn,
+        },
+    )
+
+
+def upsert_monthly_company_information_query(company_id: int, data):
+    return bulk_upsert_monthly_company_information_query(company_id, [data]).returning(
+        MonthlyCompanyData
+    )
+
+
 def get_all_distinct_years_for_the_user_company_by_id_query(company_id: int):
     return select(MonthlyCompanyData.year).filter_by(company_id=company_id).distinct()
 
@@ -26,8 +93,74 @@ def get_data_for_the_selected_year_and_attribute_query(
 ):
     return (
         select(
-            getattr(MonthlyCompanyData, selected_attribute), MonthlyCompanyData.month
+            getattr(MonthlyCompanyData, selected_attribute),
+            MonthlyCompanyData.month_number,
         )
         .filter_by(company_id=company_id, year=selected_year)
-        .order_by(MonthlyCompanyData.month)
+        .order_by(MonthlyCompanyData.month_number)
+    )
+
+
+def get_data_for_the_selected_year_query(company_id: int, selected_year: int):
+    return (
+        select(
+            MonthlyCompanyData.month_number,
+            MonthlyCompanyData.income,
+            MonthlyCompanyData.expenses,
+            MonthlyCompanyData.profit,
+            MonthlyCompanyData.kpn,
+        )
+        .filter_by(company_id=company_id, year=selected_year)
+        .order_by(MonthlyCompanyData.month_number)
+    )
+
+
+def get_company_history_query(company_id: int):
+    return (
+        select(
+            MonthlyCompanyData.year,
+            MonthlyCompanyData.month_number,
+            MonthlyCompanyData.income,
+            MonthlyCompanyData.expenses,
+            MonthlyCompanyData.profit,
+            MonthlyCompanyData.kpn,
+        )
+        .filter_by(company_id=company_id)
+        .order_by(MonthlyCompanyData.year, MonthlyCompanyData.month_number)
+    )
+
+
+def get_monthly_data_export_query(company_id: int | None, partition_size: int):
+    columns = [
+        MonthlyCompanyData.year,
+        MonthlyCompanyData.month,
+        MonthlyCompanyData.income,
+        MonthlyCompanyData.expenses,
+        MonthlyCompanyData.profit,
+        MonthlyCompanyData.kpn,
+    ]
+
+    if company_id is not None:
+        query = select(*columns).filter_by(company_id=company_id)
+        order_by = []
+    else:
+        query = select(Company.name, *columns).join(
+            Company, Company.id == MonthlyCompanyData.company_id
+        )
+        order_by = [MonthlyCompanyData.company_id]
+
+    return query.order_by(
+        *order_by, MonthlyCompanyData.year, MonthlyCompanyData.month_number
+    ).execution_options(yield_per=partition_size)
+
+
+def get_company_data_version_query(company_id: int):
+    return select(Company.data_version).filter_by(id=company_id)
+
+
+def bump_company_data_version_query(company_id: int):
+    return (
+        update(Company)
+        .filter_by(id=company_id)
+        .values(data_version=Company.data_version + 1)
     )
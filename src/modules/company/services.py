@@ -1,18 +1,47 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models import Company, MonthlyCompanyData
+from src.cache import LRUCache
+from src.config import settings
+from src.models import Company
+from src.modules.chart.cache import evict_company_charts
+from src.modules.user.services import invalidate_user_identity
 from src.modules.company.queries import (
-    get_monthly_company_information_query,
+    upsert_monthly_company_information_query,
+    bulk_upsert_monthly_company_information_query,
     get_all_distinct_years_for_the_user_company_by_id_query,
     get_data_for_the_selected_year_and_attribute_query,
+    get_data_for_the_selected_year_query,
     get_company_list_query,
     get_company_by_name_query,
+    delete_company_query,
+    get_company_history_query,
+    get_company_data_version_query,
+    bump_company_data_version_query,
 )
 
+company_directory_cache = LRUCache(max_entries=settings.COMPANY_CACHE_MAX_ENTRIES)
+
+
+def invalidate_company_directory(company_id: int, company_name: str | None = None):
+    company_directory_cache.invalidate(("years", company_id))
+    company_directory_cache.invalidate_where(lambda key: key[0] == "list")
+    if company_name is not None:
+        company_directory_cache.invalidate(("name", company_name))
+
+
+def invalidate_company_data(company_id: int):
+    evict_company_charts(company_id)
+    invalidate_company_directory(company_id)
+
 
 async def get_or_none_company_by_name(company_name: str, session: AsyncSession):
-    instance = await session.execute(get_company_by_name_query(company_name))
-    return instance.scalar_one_or_none()
+    async def load_company():
+        instance = await session.execute(get_company_by_name_query(company_name))
+        return instance.scalar_one_or_none()
+
+    return await company_directory_cache.get_or_load(
+        ("name", company_name), load_company, ttl=settings.COMPANY_NAME_CACHE_TTL
+    )
 
 
 async def create_company(user_id: int, company_name: str, session: AsyncSession):
@@ -22,65 +51,90 @@ async def create_company(user_id: int, company_name: str, session: AsyncSession)
     await session.commit()
 
     await session.refresh(instance)
+
+    invalidate_user_identity(user_id)
+    company_directory_cache.invalidate(("name", company_name))
     return instance
 
 
 async def delete_company(company: Company, session: AsyncSession):
-    await session.delete(company)
+    await session.execute(delete_company_query(company.id))
     await session.commit()
 
+    evict_company_charts(company.id)
+    invalidate_company_directory(company.id, company.name)
+    invalidate_user_identity(company.user_id)
+
     return "Company has been deleted."
 
 
 async def create_or_update_monthly_company_information_instance(
     data, company: Company, session: AsyncSession
 ):
-    year = data["year"]
-    month = data["month"]
-    income = data["income"]
-    expenses = data["expenses"]
-    profit = data["profit"]
-    kpn = data["kpn"]
-
-    instance = await session.execute(
-        get_monthly_company_information_query(company.id, year, month)
+    result = await session.scalars(
+        upsert_monthly_company_information_query(company.id, data),
+        execution_options={"populate_existing": True},
     )
-    instance = instance.scalar_one_or_none()
-
-    if instance:
-        instance.income = income
-        instance.expenses = expenses
-        instance.profit = profit
-        instance.kpn = kpn
-    else:
-        instance = MonthlyCompanyData(
-            company_id=company.id,
-            year=data["year"],
-            month=data["month"],
-            income=data["income"],
-            expenses=data["expenses"],
-            profit=data["profit"],
-            kpn=data["kpn"],
-        )
-        session.add(instance)
-
+    instance = result.one()
+    await session.execute(bump_company_data_version_query(company.id))
     await session.commit()
-    await session.refresh(instance)
+
+    invalidate_company_data(company.id)
     return instance
 
 
-async def get_company_list(session: AsyncSession):
-    result = await session.execute(get_company_list_query())
-    return result.scalars().all()
+async def bulk_upsert_monthly_company_information(
+    rows, company: Company, session: AsyncSession
+):
+    await session.execute(
+        bulk_upsert_monthly_company_information_query(company.id, rows)
+    )
+    await session.execute(bump_company_data_version_query(company.id))
+
+
+async def get_company_data_version(company_id: int, session: AsyncSession):
+    return await session.scalar(get_company_data_version_query(company_id)) or 0
+
+
+async def get_company_list(
+    session: AsyncSession,
+    after_company_id: int | None = None,
+    before_company_id: int | None = None,
+):
+    page_size = settings.COMPANY_LIST_PAGE_SIZE
+
+    async def load_company_list():
+        result = await session.execute(
+            get_company_list_query(page_size, after_company_id, before_company_id)
+        )
+        return result.all()
+
+    companies = await company_directory_cache.get_or_load(
+        ("list", after_company_id, before_company_id),
+        load_company_list,
+        ttl=settings.COMPANY_LIST_CACHE_TTL,
+    )
+
+    has_more = len(companies) > page_size
+    companies = companies[:page_size]
+
+    if before_company_id is not None:
+        return companies[::-1], has_more, True
+    return companies, after_company_id is not None, has_more
 
 
 async def get_all_distinct_years_for_the_user_company_by_id(
     company_id: int, session: AsyncSession
 ):
-    result = await session.execute(
-        get_all_distinct_years_for_the_user_company_by_id_query(company_id)
+    async def load_years():
+        result = await session.execute(
+            get_all_distinct_years_for_the_user_company_by_id_query(company_id)
+        )
+        return result.scalars().all()
+
+    return await company_directory_cache.get_or_load(
+        ("years", company_id), load_years, ttl=settings.COMPANY_YEARS_CACHE_TTL
     )
-    return result.scalars().all()
 
 
 async def get_data_for_the_selected_year_and_attribute(
@@ -92,3 +146,17 @@ async def get_data_for_the_selected_year_and_attribute(
         )
     )
     return results.all()
+
+
+async def get_data_for_the_selected_year(
+    company_id: int, selected_year: int, session: AsyncSession
+):
+    results = await session.execute(
+        get_data_for_the_selected_year_query(company_id, selected_year)
+    )
+    return results.all()
+
+
+async def get_company_history(company_id: int, session: AsyncSession):
+    results = await session.execute(get_company_history_query(company_id))
+    return results.all()
@@ -0,0 +1,158 @@
+from src.models import MONTH_NAMES
+
+ROLLING_WINDOWS = (3, 12)
+
+
+def divide(numerator, denominator):
+    if not denominator:
+        return None
+    return float(numerator / denominator)
+
+
+def calculate_company_statistics(rows):
+    import numpy as np
+
+    history = np.asarray(rows, dtype=np.float64)
+    years, month_numbers, income, expenses, profit, kpn = history.T
+
+    first_year = int(years[0])
+    periods = ((years - first_year) * 12 + month_numbers - 1).astype(np.intp)
+    year_indexes = periods // 12
+
+    year_months = np.bincount(year_indexes)
+    year_income = np.bincount(year_indexes, weights=income)
+    year_profit = np.bincount(year_indexes, weights=profit)
+    present_years = np.flatnonzero(year_months)
+
+    yearly_income = year_income[present_years]
+
+    # Growth compares only the months reported in both years, so a partial
+    # year is not measured against a full one.
+    income_by_month = np.zeros((len(year_months), 12))
+    income_by_month[year_indexes, periods % 12] = income
+    reported = np.zeros(income_by_month.shape, dtype=bool)
+    reported[year_indexes, periods % 12] = True
+    common = reported[1:] & reported[:-1]
+    previous_income = (income_by_month[:-1] * common).sum(axis=1)
+    current_income = (income_by_month[1:] * common).sum(axis=1)
+    growth_by_year = np.full(len(year_months), np.nan)
+    np.divide(
+        current_income - previous_income,
+        previous_income,
+        out=growth_by_year[1:],
+        where=previous_income > 0,
+    )
+    growth = growth_by_year[present_years]
+
+    monthly = np.zeros((3, periods[-1] + 1))
+    monthly[:, periods] = np.vstack((income, profit, np.ones_like(income)))
+    cumulative = np.concatenate((np.zeros((3, 1)), np.cumsum(monthly, axis=1)), axis=1)
+
+    rolling = {}
+    for window in ROLLING_WINDOWS:
+        sums = cumulative[:, window:] - cumulative[:, :-window]
+        if not sums.shape[1]:
+            sums = cumulative[:, -1:]
+
+        averages = np.divide(
+            sums[:2], sums[2], out=np.full(sums[:2].shape, np.nan), where=sums[2] > 0
+        )
+        previous = averages[:, -1 - window] if averages.shape[1] > window else None
+        rolling[window] = (averages[:, -1], previous)
+
+    projection = None
+    if len(periods) > 1:
+        slopes, intercepts = np.polyfit(periods, np.column_stack((income, profit)), 1)
+        next_period = int(periods[-1]) + 1
+        projected_income, projected_profit = np.maximum(
+            slopes * next_period + intercepts, 0
+        )
+        projection = (
+            first_year + next_period // 12,
+            next_period % 12 + 1,
+            float(projected_income),
+            float(projected_profit),
+        )
+
+    total_income, total_profit = income.sum(), profit.sum()
+    return {
+        "months": len(history),
+        "first_period": (first_year, int(month_numbers[0])),
+        "last_period": (int(years[-1]), int(month_numbers[-1])),
+        "yearly": list(
+            zip(
+                (present_years + first_year).tolist(),
+                year_months[present_years].tolist(),
+                yearly_income.tolist(),
+                year_profit[present_years].tolist(),
+                [None if np.isnan(value) else value for value in growth.tolist()],
+            )
+        ),
+        "rolling": rolling,
+        "total_income": float(total_income),
+        "total_expenses": float(expenses.sum()),
+        "margin": divide(total_profit, total_income),
+        "latest_margin": divide(year_profit[-1], year_income[-1]),
+        "tax_ratio": divide(kpn.sum(), total_profit),
+        "projection": projection,
+    }
+
+
+def format_period(period):
+    year, month_number = period
+    return f"{MONTH_NAMES[month_number]} {year}"
+
+
+def format_months(months: int):
+    return "1 month" if months == 1 else f"{months} months"
+
+
+def format_ratio(value):
+    return "n/a" if value is None else f"{value:.1%}"
+
+
+def format_company_statistics(company_name: str, statistics: dict):
+    lines = [
+        f"Statistics for {company_name}",
+        f"{format_months(statistics['months'])} of data, "
+        f"{format_period(statistics['first_period'])} - "
+        f"{format_period(statistics['last_period'])}",
+        "",
+        "Yearly income / profit:",
+    ]
+
+    for year, months, income, profit, growth in statistics["yearly"]:
+        line = f"{year} ({months} mo): {income:,.0f} / {profit:,.0f}"
+        if growth is not None:
+            line += f", {growth:+.1%} YoY on the same months"
+        lines.append(line)
+
+    lines.append("")
+    for window, (averages, previous) in statistics["rolling"].items():
+        income, profit = averages
+        line = f"{window}-month average income / profit: "
+        line += f"{income:,.0f} / {profit:,.0f}"
+        if previous is not None and previous[0] > 0:
+            line += f" ({income / previous[0] - 1:+.1%} income)"
+        lines.append(line)
+
+    lines.extend(
+        (
+            "",
+            f"Total income: {statistics['total_income']:,.0f}, "
+            f"expenses: {statistics['total_expenses']:,.0f}",
+            f"Profit margin: {format_ratio(statistics['margin'])} "
+            f"(latest year {format_ratio(statistics['latest_margin'])})",
+            f"Tax ratio (KPN / profit): {format_ratio(statistics['tax_ratio'])}",
+        )
+    )
+
+    projection = statistics["projection"]
+    if projection is not None:
+        year, month_number, income, profit = projection
+        lines.append(
+            f"Trend projection for {format_period((year, month_number))}: "
+            f"income ~{income:,.0f}, profit ~{profit:,.0f}"
+        )
+
+    return "\n".join(lines)
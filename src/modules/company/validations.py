@@ -47,3 +47,32 @@ def company_information_field_positive_validation(
     if attribute_first < 0:
         return False, f"{attribute_second} must be a positive integer."
     return True, "OK"
+
+
+def company_information_row_validation(row: dict):
+    data = {}
+
+    for field in ("year", "income", "expenses", "profit", "kpn"):
+        value = row.get(field)
+        try:
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            data[field] = int(str(value).strip())
+        except (TypeError, ValueError):
+            return False, f"{field} must be an integer."
+
+    data["month"] = str(row.get("month") or "").strip().capitalize()
+
+    validations = [
+        company_information_year_validation(data["year"]),
+        company_information_month_validation(data["month"]),
+        *(
+            company_information_field_positive_validation(data[field], field)
+            for field in ("income", "expenses", "profit", "kpn")
+        ),
+    ]
+    for is_valid, content in validations:
+        if not is_valid:
+            return False, content
+
+    return True, data
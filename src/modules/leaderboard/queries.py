@@ -0,0 +1,82 @@
+from sqlalchemy import delete, func, insert, select
+
+from src.models import Company, CompanyYearlyTotals, MonthlyCompanyData
+
+LEADERBOARD_FIELDS = ("income", "profit")
+LEADERBOARD_REFRESH_LOCK_ID = 7_240_023
+
+
+def try_lock_leaderboard_refresh_query():
+    return select(func.pg_try_advisory_xact_lock(LEADERBOARD_REFRESH_LOCK_ID))
+
+
+def get_rank_column(field: str):
+    return getattr(CompanyYearlyTotals, f"{field}_rank")
+
+
+def get_company_yearly_totals_query():
+    totals = (
+        select(
+            MonthlyCompanyData.company_id,
+            MonthlyCompanyData.year,
+            func.sum(MonthlyCompanyData.income).label("income"),
+            func.sum(MonthlyCompanyData.profit).label("profit"),
+        )
+        .group_by(MonthlyCompanyData.company_id, MonthlyCompanyData.year)
+        .subquery()
+    )
+
+    return select(
+        totals.c.company_id,
+        totals.c.year,
+        totals.c.income,
+        totals.c.profit,
+        *(
+            func.row_number()
+            .over(
+                partition_by=totals.c.year,
+                order_by=(totals.c[field].desc(), totals.c.company_id),
+            )
+            .label(f"{field}_rank")
+            for field in LEADERBOARD_FIELDS
+        ),
+    )
+
+
+def delete_company_yearly_totals_query():
+    return delete(CompanyYearlyTotals)
+
+
+def insert_company_yearly_totals_query():
+    return insert(CompanyYearlyTotals).from_select(
+        ["company_id", "year", "income", "profit", "income_rank", "profit_rank"],
+        get_company_yearly_totals_query(),
+    )
+
+
+def get_latest_leaderboard_year_query():
+    return select(func.max(CompanyYearlyTotals.year))
+
+
+def get_leaderboard_page_query(year: int, field: str, page: int, page_size: int):
+    rank = get_rank_column(field)
+    return (
+        select(rank.label("rank"), Company.name, getattr(CompanyYearlyTotals, field))
+        .join(Company, Company.id == CompanyYearlyTotals.company_id)
+        .where(
+            CompanyYearlyTotals.year == year,
+            rank > page * page_size,
+            rank <= (page + 1) * page_size + 1,
+        )
+        .order_by(rank)
+    )
+
+
+def get_company_leaderboard_position_query(company_id: int, year: int, field: str):
+    rank = get_rank_column(field)
+    ranked_count = (
+        select(func.max(rank)).where(CompanyYearlyTotals.year == year).scalar_subquery()
+    )
+    return select(
+        rank, getattr(CompanyYearlyTotals, field), ranked_count.label("count")
+    ).filter_by(company_id=company_id, year=year)
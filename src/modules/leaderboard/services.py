@@ -0,0 +1,79 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.database import async_engine, async_session_factory
+from src.modules.leaderboard.queries import (
+    try_lock_leaderboard_refresh_query,
+    delete_company_yearly_totals_query,
+    insert_company_yearly_totals_query,
+    get_latest_leaderboard_year_query,
+    get_leaderboard_page_query,
+    get_company_leaderboard_position_query,
+)
+
+_refresh_task: asyncio.Task | None = None
+
+
+async def refresh_leaderboard():
+    async with async_session_factory() as session:
+        if async_engine.dialect.name == "postgresql":
+            is_locked = await session.scalar(try_lock_leaderboard_refresh_query())
+            if not is_locked:
+                logging.info("Leaderboard is being refreshed by another process")
+                return
+
+        await session.execute(delete_company_yearly_totals_query())
+        await session.execute(insert_company_yearly_totals_query())
+        await session.commit()
+
+
+async def run_leaderboard_refresher():
+    while True:
+        try:
+            await refresh_leaderboard()
+        except Exception as exception:
+            logging.error(f"Error while refreshing the leaderboard: {str(exception)}")
+
+        await asyncio.sleep(settings.LEADERBOARD_REFRESH_INTERVAL)
+
+
+async def start_leaderboard_refresher():
+    global _refresh_task
+
+    if not settings.LEADERBOARD_REFRESH_ENABLED:
+        return
+
+    _refresh_task = asyncio.create_task(run_leaderboard_refresher())
+
+
+async def stop_leaderboard_refresher():
+    global _refresh_task
+
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        _refresh_task = None
+
+
+async def get_latest_leaderboard_year(session: AsyncSession):
+    return await session.scalar(get_latest_leaderboard_year_query())
+
+
+async def get_leaderboard_page(year: int, field: str, page: int, session: AsyncSession):
+    page_size = settings.LEADERBOARD_PAGE_SIZE
+    results = await session.execute(
+        get_leaderboard_page_query(year, field, page, page_size)
+    )
+    rows = results.all()
+    return rows[:page_size], len(rows) > page_size
+
+
+async def get_company_leaderboard_position(
+    company_id: int, year: int, field: str, session: AsyncSession
+):
+    results = await session.execute(
+        get_company_leaderboard_position_query(company_id, year, field)
+    )
+    return results.one_or_none()
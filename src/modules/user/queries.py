@@ -1,8 +1,33 @@
 from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, contains_eager, joinedload
 
+from src.database import get_dialect_insert
 from src.models import User
 
 
 def get_user_query(user_id: int):
     return select(User).options(joinedload(User.company)).filter_by(id=user_id)
+
+
+def upsert_user_query(user_id: int, username: str):
+    statement = get_dialect_insert()(User).values(id=user_id, username=username)
+    return statement.on_conflict_do_update(
+        index_elements=[User.id],
+        set_={"username": statement.excluded.username},
+        where=User.username.is_distinct_from(statement.excluded.username),
+    )
+
+
+def get_or_create_user_query(user_id: int, username: str):
+    upserted_user_cte = (
+        upsert_user_query(user_id, username)
+        .returning(User.id, User.username, User.is_admin)
+        .cte("upserted_user")
+    )
+    upserted_user = aliased(User, upserted_user_cte)
+
+    return (
+        select(upserted_user)
+        .outerjoin(upserted_user.company)
+        .options(contains_eager(upserted_user.company))
+    )
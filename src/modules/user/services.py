@@ -1,14 +1,70 @@
+from dataclasses import dataclass
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models import User
+from src.cache import LRUCache
+from src.config import settings
+from src.database import async_engine
+from src.modules.user.queries import (
+    get_user_query,
+    get_or_create_user_query,
+    upsert_user_query,
+)
+
+
+@dataclass(frozen=True)
+class CompanyIdentity:
+    id: int
+    name: str
+    user_id: int
+
+
+@dataclass(frozen=True)
+class UserIdentity:
+    id: int
+    username: str
+    is_admin: bool
+    company: CompanyIdentity | None
+
 
+user_identity_cache = LRUCache(
+    max_entries=settings.USER_CACHE_MAX_ENTRIES, ttl=settings.USER_CACHE_TTL
+)
 
-async def create_user(
+
+def invalidate_user_identity(user_id: int):
+    user_identity_cache.invalidate(user_id)
+
+
+async def get_or_create_user(
     telegram_user_id: int, telegram_user_name: str, session: AsyncSession
 ):
-    instance = User(id=telegram_user_id, username=telegram_user_name)
-    session.add(instance)
+    if async_engine.dialect.name == "sqlite":
+        await session.execute(upsert_user_query(telegram_user_id, telegram_user_name))
+        instance = None
+    else:
+        result = await session.execute(
+            get_or_create_user_query(telegram_user_id, telegram_user_name)
+        )
+        instance = result.unique().scalar_one_or_none()
+
+    if instance is None:
+        result = await session.execute(get_user_query(telegram_user_id))
+        instance = result.unique().scalar_one()
+
+    company = None
+    if instance.company is not None:
+        company = CompanyIdentity(
+            id=instance.company.id,
+            name=instance.company.name,
+            user_id=instance.company.user_id,
+        )
+    identity = UserIdentity(
+        id=instance.id,
+        username=instance.username,
+        is_admin=instance.is_admin,
+        company=company,
+    )
     await session.commit()
-    await session.refresh(instance)
 
-    return instance
+    return identity
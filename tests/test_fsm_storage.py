@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from aiogram.fsm.storage.base import StorageKey
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.bot.storage import DatabaseStorage
+
+KEY = StorageKey(bot_id=1, chat_id=2, user_id=3)
+
+
+def run_with_storage(tmp_path, scenario):
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'fsm.sqlite3'}")
+        storage = DatabaseStorage(engine=engine, flush_interval=3600)
+        await storage.setup()
+        try:
+            return await scenario(storage)
+        finally:
+            await storage.close()
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_flush_writes_dirty_records(tmp_path):
+    async def scenario(storage):
+        await storage.set_state(KEY, "Form:year")
+        await storage.set_data(KEY, {"year": 2024})
+        await storage.flush()
+
+        reloaded = DatabaseStorage(engine=storage.engine)
+        return (
+            storage._dirty,
+            await reloaded.get_state(KEY),
+            await reloaded.get_data(KEY),
+        )
+
+    dirty, state, data = run_with_storage(tmp_path, scenario)
+
+    assert dirty == {}
+    assert state == "Form:year"
+    assert data == {"year": 2024}
+
+
+def test_failed_flush_restores_dirty_records(tmp_path):
+    async def scenario(storage):
+        async def fail_to_write_records(records):
+            await storage.set_data(KEY, {"year": 2025})
+            raise ConnectionError("database is unavailable")
+
+        await storage.set_data(KEY, {"year": 2024})
+        storage._write_records = fail_to_write_records
+        with pytest.raises(ConnectionError):
+            await storage.flush()
+
+        dirty_data = storage._dirty[DatabaseStorage.build_key(KEY)][1]
+        del storage._write_records
+        await storage.flush()
+
+        reloaded = DatabaseStorage(engine=storage.engine)
+        return dirty_data, await reloaded.get_data(KEY)
+
+    dirty_data, data = run_with_storage(tmp_path, scenario)
+
+    assert dirty_data == {"year": 2025}
+    assert data == {"year": 2025}
+
+
+def test_cancelled_flush_restores_dirty_records(tmp_path):
+    async def scenario(storage):
+        write_started = asyncio.Event()
+
+        async def block_write_records(records):
+            write_started.set()
+            await asyncio.Event().wait()
+
+        await storage.set_state(KEY, "Form:month")
+        storage._write_records = block_write_records
+        flush = asyncio.create_task(storage.flush())
+        await write_started.wait()
+        flush.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flush
+
+        dirty = dict(storage._dirty)
+        del storage._write_records
+        return dirty
+
+    dirty = run_with_storage(tmp_path, scenario)
+
+    assert dirty == {DatabaseStorage.build_key(KEY): ("Form:month", {})}
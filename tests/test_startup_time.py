@@ -0,0 +1,15 @@
+from benchmarks.startup_time import measure_startup_overhead
+
+MAX_BOT_IMPORT_OVERHEAD = 1.5
+
+
+def test_bot_import_does_not_load_heavy_modules():
+    _, _, heavy_modules = measure_startup_overhead(runs=1)
+
+    assert heavy_modules == []
+
+
+def test_bot_import_overhead_stays_under_target():
+    _, import_time, _ = measure_startup_overhead(runs=3)
+
+    assert import_time < MAX_BOT_IMPORT_OVERHEAD
@@ -0,0 +1,52 @@
+import logging
+import multiprocessing
+import sys
+
+from aiohttp import web
+
+from main import create_bot, set_commands
+from src.bot.webhook import create_router_application, run_worker
+from src.config import settings
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+
+
+async def set_webhook(application: web.Application):
+    if not settings.WEBHOOK_BASE_URL:
+        logging.warning("WEBHOOK_BASE_URL is not set, skipping webhook registration")
+        return
+
+    bot = create_bot()
+    try:
+        await set_commands(bot)
+        await bot.set_webhook(
+            url=f"{settings.WEBHOOK_BASE_URL}{settings.WEBHOOK_PATH}",
+            secret_token=settings.WEBHOOK_SECRET,
+            max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+        )
+    finally:
+        await bot.session.close()
+
+
+def main():
+    workers = [
+        multiprocessing.Process(target=run_worker, args=(worker_index,))
+        for worker_index in range(settings.WEBHOOK_WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+
+    application = create_router_application(settings.WEBHOOK_WORKERS)
+    application.on_startup.append(set_webhook)
+
+    try:
+        web.run_app(application, host=settings.WEBHOOK_HOST, port=settings.WEBHOOK_PORT)
+    finally:
+        for worker in workers:
+            worker.terminate()
+            worker.join()
+
+
+if __name__ == "__main__":
+    logging.info("Bot is Starting in webhook mode")
+    main()